@@ -1,6 +1,7 @@
 from collections.abc import Generator
 from datetime import datetime, timezone
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, NamedTuple
 
 from fastapi import Depends, Request, Security
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
@@ -9,16 +10,16 @@ from sqlalchemy.orm import Session
 from backend.application.auth_service import decode_access_token
 from backend.application.movie_service import MovieQueryService
 from backend.core.logging import get_logger
-from backend.core.settings import Settings, get_settings
+from backend.core.settings import get_settings
 from backend.domain.errors import (
     InsufficientPermissionsError,
     InvalidTokenError,
     UserDisabledError,
 )
-from backend.infrastructure.db.models.user import User
 from backend.infrastructure.db.repositories.movie import MovieRepository
 from backend.infrastructure.db.repositories.queue import QueueRepository
 from backend.infrastructure.db.repositories.recommendation import RecommendationRepository
+from backend.infrastructure.db.repositories.stats import StatsRepository
 from backend.infrastructure.db.repositories.user import UserRepository
 
 logger = get_logger(__name__)
@@ -60,6 +61,10 @@ def get_recommendation_repo(session: DbSession) -> RecommendationRepository:
     return RecommendationRepository(session)
 
 
+def get_stats_repo(session: DbSession) -> StatsRepository:
+    return StatsRepository(session)
+
+
 def get_movie_service(
     movie_repo: Annotated[MovieRepository, Depends(get_movie_repo)],
     request: Request,
@@ -72,54 +77,64 @@ MovieRepoDep = Annotated[MovieRepository, Depends(get_movie_repo)]
 UserRepoDep = Annotated[UserRepository, Depends(get_user_repo)]
 QueueRepoDep = Annotated[QueueRepository, Depends(get_queue_repo)]
 RecommendationRepoDep = Annotated[RecommendationRepository, Depends(get_recommendation_repo)]
+StatsRepoDep = Annotated[StatsRepository, Depends(get_stats_repo)]
 MovieServiceDep = Annotated[MovieQueryService, Depends(get_movie_service)]
 
 
-from backend.api.schemas.auth import ValidateTokenData
+@lru_cache
+def _get_jwt_params() -> tuple[str, str]:
+    security = get_settings().security
+    return security.secret_key, security.jwt_algorithm
+
+
+class AuthedUser(NamedTuple):
+    """Column-only view of the authenticated user; avoids hydrating the full ORM object per request."""
+
+    id: int
+    email: str
+    disabled: bool
+    scopes: str
+    access_token_scopes: list[str]
+    access_token_exp: float
+
+    @property
+    def scope_set(self) -> frozenset[str]:
+        return frozenset(self.scopes.split(" "))
+
+    @property
+    def access_token_expires(self) -> datetime:
+        return datetime.fromtimestamp(self.access_token_exp, tz=timezone.utc)
 
 
 def get_current_user(
     security_scopes: SecurityScopes,
     token: Annotated[str, Depends(oauth2_scheme)],
     session: DbSession,
-    settings: Settings = Depends(get_settings),
-) -> User:
-    payload = decode_access_token(
-        token, settings.security.secret_key, settings.security.jwt_algorithm
-    )
-    scope: str = payload.get("scope", "")
-    try:
-        token_data = ValidateTokenData(
-            email=payload.get("sub"),
-            scopes=scope.split(" "),
-            access_token_expires=datetime.fromtimestamp(payload.get("exp"), tz=timezone.utc),
-        )
-    except Exception as e:
-        logger.warning(f"Token data validation failed: {e}")
-        raise InvalidTokenError("Could not validate credentials")
+) -> AuthedUser:
+    secret_key, algorithm = _get_jwt_params()
+    # decode_access_token has already checked the signature, expiry and that "sub" is a string.
+    payload = decode_access_token(token, secret_key, algorithm)
+    token_scopes = payload.get("scope", "").split(" ")
 
     user_repo = UserRepository(session)
-    user = user_repo.find_by_email(email=token_data.email)
-    if user is None:
+    row = user_repo.find_auth_fields_by_email(email=payload["sub"])
+    if row is None:
         raise InvalidTokenError("Could not validate credentials")
+    user = AuthedUser(*row, access_token_scopes=token_scopes, access_token_exp=payload["exp"])
 
-    user_scopes = user.get_scopes()
-    for scope in security_scopes.scopes:
-        if scope not in token_data.scopes or scope not in user_scopes:
-            raise InsufficientPermissionsError("Not enough permissions")
-
-    user.access_token_scopes = token_data.scopes
-    user.access_token_expires = token_data.access_token_expires
+    required_scopes = frozenset(security_scopes.scopes)
+    if not (required_scopes <= frozenset(token_scopes) and required_scopes <= user.scope_set):
+        raise InsufficientPermissionsError("Not enough permissions")
     return user
 
 
 def get_current_active_user(
-    current_user: Annotated[User, Security(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthedUser, Security(get_current_user)],
+) -> AuthedUser:
     if current_user.disabled:
         raise UserDisabledError()
     return current_user
 
 
-AuthedUser_MR = Annotated[User, Security(get_current_active_user, scopes=["movie:read"])]
-AuthedUser_MW = Annotated[User, Security(get_current_active_user, scopes=["movie:write"])]
+AuthedUser_MR = Annotated[AuthedUser, Security(get_current_active_user, scopes=["movie:read"])]
+AuthedUser_MW = Annotated[AuthedUser, Security(get_current_active_user, scopes=["movie:write"])]
@@ -1,5 +1,7 @@
+import json
+
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from backend.domain.errors import (
     DomainError,
@@ -37,17 +39,28 @@ _ERROR_MAP: dict[type[DomainError], tuple[int, str, dict[str, str] | None]] = {
 }
 
 
+_INTERNAL_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error", None)
+
+# Rendered response bodies keyed by concrete exception type; subclasses are memoised on first use.
+_RESPONSES: dict[type[Exception], tuple[int, bytes, dict[str, str] | None]] = {}
+
+
+def _render(entry: tuple[int, str, dict[str, str] | None]) -> tuple[int, bytes, dict[str, str] | None]:
+    status_code, detail, headers = entry
+    body = json.dumps({"detail": detail}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return status_code, body, headers
+
+
+def _resolve(exc_type: type[Exception]) -> tuple[int, bytes, dict[str, str] | None]:
+    resolved = _RESPONSES.get(exc_type)
+    if resolved is None:
+        entry = next((_ERROR_MAP[t] for t in exc_type.__mro__ if t in _ERROR_MAP), _INTERNAL_ERROR)
+        resolved = _RESPONSES[exc_type] = _render(entry)
+    return resolved
+
+
 def register_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(DomainError)
-    async def domain_error_handler(request: Request, exc: DomainError) -> JSONResponse:
-        for error_type, (status_code, detail, headers) in _ERROR_MAP.items():
-            if isinstance(exc, error_type):
-                return JSONResponse(
-                    status_code=status_code,
-                    content={"detail": detail},
-                    headers=headers,
-                )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"},
-        )
+    async def domain_error_handler(request: Request, exc: DomainError) -> Response:
+        status_code, body, headers = _resolve(type(exc))
+        return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
@@ -3,16 +3,16 @@ import sys
 import time
 from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query, Request, status
 
-from backend.api.deps import AuthedUser_MW, DbSession, MovieRepoDep, QueueRepoDep, UserRepoDep
+from backend.api.deps import AuthedUser_MW, DbSession, QueueRepoDep, StatsRepoDep, UserRepoDep
 from backend.api.schemas.admin import (
-    AdminUserItem,
     AdminUserList,
     BackupItem,
     LogsResponse,
-    QueueItem,
     QueueList,
     QueueRefreshRequest,
     SchedulerJobItem,
@@ -22,16 +22,21 @@ from backend.api.schemas.admin import (
     UpdateScopesRequest,
     UpdateStatusRequest,
     UpdateTmdbKeyRequest,
+    admin_user_list_adapter,
+    queue_item_list_adapter,
 )
 from backend.api.schemas.common import BackupResponse, DetailResponse, QueueRefreshResponse, ScopeUpdateResponse
-from backend.core.settings import get_settings
+from backend.core.settings import SettingsDep, get_settings
 from backend.domain.errors import NotFoundError
 from backend.infrastructure.backup.backup_service import backup_db
-from backend.infrastructure.db.models import MovieQueue, QueueStatus
+from backend.infrastructure.db.models import QueueStatus
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-VALID_SCOPES = {"movie:read", "movie:write"}
+VALID_SCOPES: frozenset[str] = frozenset({"movie:read", "movie:write"})
+BACKUP_LISTING_TTL = 5
+
+_STATUS_LOOKUP: dict[str, QueueStatus] = {s.value: s for s in QueueStatus}
 
 _start_time = time.monotonic()
 
@@ -51,17 +56,41 @@ def _get_dir_size(path: str) -> int:
     return total
 
 
+@lru_cache(maxsize=4)
+def _scan_backups(backup_path: Path, _dir_mtime_ns: int, _ttl_bucket: int) -> tuple[tuple[str, int, float], ...]:
+    try:
+        with os.scandir(backup_path) as it:
+            backups = [
+                (e.name, (st := e.stat()).st_size, st.st_mtime) for e in it if e.name.endswith(".db") and e.is_file()
+            ]
+    except FileNotFoundError:
+        return ()
+    backups.sort(key=lambda b: b[2], reverse=True)
+    return tuple(backups)
+
+
+def _list_backups(backup_path: Path) -> tuple[tuple[str, int, float], ...]:
+    """(filename, size, mtime) of each backup, newest first; shared across endpoints for a few seconds.
+
+    Keyed on the directory mtime, so backups added or removed by another worker or by cron show up
+    on the next call; the TTL only bounds how stale the size of a backup still being written can be.
+    """
+    try:
+        dir_mtime_ns = backup_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _scan_backups(backup_path, dir_mtime_ns, int(time.monotonic() // BACKUP_LISTING_TTL))
+
+
 # ── Sync ──────────────────────────────────────────────────────────────────
 
 @router.get("/sync", summary="Sync Movie and MovieQueue tables", status_code=status.HTTP_200_OK)
 def sync_tables(admin: AuthedUser_MW, queue_repo: QueueRepoDep, session: DbSession) -> DetailResponse:
-    movies = queue_repo.find_movies_without_queue()
-    if not movies:
+    count = queue_repo.insert_missing()
+    if not count:
         raise NotFoundError()
-    for movie in movies:
-        queue_repo.add(MovieQueue(tmdb_id=movie.tmdb_id))
     session.commit()
-    return DetailResponse(detail=f"Recreated '{len(movies)}' missing MovieQueue entries.")
+    return DetailResponse(detail=f"Recreated '{count}' missing MovieQueue entries.")
 
 
 # ── Users ─────────────────────────────────────────────────────────────────
@@ -73,13 +102,18 @@ def list_users(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     search: str = Query("", description="Filter by email"),
+    prefix: bool = Query(False, description="Match the search only at the start of the email"),
+    after_id: int | None = Query(None, ge=0, description="Cursor from next_cursor; takes precedence over page"),
 ) -> AdminUserList:
-    users, total = user_repo.list_paginated(page=page, per_page=per_page, search=search)
+    users, total = user_repo.list_paginated(
+        page=page, per_page=per_page, search=search, prefix=prefix, after_id=after_id,
+    )
     return AdminUserList(
-        users=[AdminUserItem.model_validate(u) for u in users],
+        users=admin_user_list_adapter.validate_python(users, from_attributes=True),
         total=total,
         page=page,
         per_page=per_page,
+        next_cursor=users[-1].id if len(users) == per_page else None,
     )
 
 
@@ -87,44 +121,41 @@ def list_users(
 def update_user_scopes(
     user_id: int, body: UpdateScopesRequest, admin: AuthedUser_MW, user_repo: UserRepoDep, session: DbSession,
 ) -> ScopeUpdateResponse:
-    if invalid := [s for s in body.scopes if s not in VALID_SCOPES]:
-        raise HTTPException(status_code=400, detail=f"Invalid scope(s): {', '.join(invalid)}")
+    if invalid := frozenset(body.scopes) - VALID_SCOPES:
+        raise HTTPException(status_code=400, detail=f"Invalid scope(s): {', '.join(sorted(invalid))}")
     if not body.scopes:
         raise HTTPException(status_code=400, detail="At least one scope is required")
-    user = user_repo.find_by_id(user_id)
-    if not user:
+    scopes = " ".join(body.scopes)
+    email = user_repo.update_scopes(user_id, scopes)
+    if email is None:
         raise NotFoundError()
-    user.scopes = " ".join(body.scopes)
     session.commit()
-    return ScopeUpdateResponse(detail=f"Scopes updated for {user.email}", scopes=user.scopes)
+    return ScopeUpdateResponse(detail=f"Scopes updated for {email}", scopes=scopes)
 
 
 @router.patch("/users/{user_id}/status", summary="Enable or disable a user")
 def update_user_status(
     user_id: int, body: UpdateStatusRequest, admin: AuthedUser_MW, user_repo: UserRepoDep, session: DbSession,
 ) -> DetailResponse:
-    user = user_repo.find_by_id(user_id)
-    if not user:
-        raise NotFoundError()
-    if user.email == admin.email:
+    if user_id == admin.id:
         raise HTTPException(status_code=400, detail="Cannot change your own status")
-    user.disabled = body.disabled
+    email = user_repo.update_disabled(user_id, body.disabled)
+    if email is None:
+        raise NotFoundError()
     session.commit()
-    return DetailResponse(detail=f"User {user.email} has been {'disabled' if body.disabled else 'enabled'}")
+    return DetailResponse(detail=f"User {email} has been {'disabled' if body.disabled else 'enabled'}")
 
 
 # ── Database ──────────────────────────────────────────────────────────────
 
 @router.post("/backup", summary="Create a database backup")
-def create_backup(admin: AuthedUser_MW) -> BackupResponse:
-    settings = get_settings()
+def create_backup(admin: AuthedUser_MW, settings: SettingsDep) -> BackupResponse:
     try:
-        backup_db(settings.database.database_file, settings.database.backup_path)
-        backups = sorted(settings.database.backup_path.glob("*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
-        latest = backups[0] if backups else None
+        destination_path = backup_db(settings.database.database_file, settings.database.backup_path)
+        _scan_backups.cache_clear()
         return BackupResponse(
             detail="Backup created successfully",
-            filename=latest.name if latest else None,
+            filename=destination_path.name,
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
     except Exception as e:
@@ -132,16 +163,14 @@ def create_backup(admin: AuthedUser_MW) -> BackupResponse:
 
 
 @router.get("/backups", summary="List database backups")
-def list_backups(admin: AuthedUser_MW) -> list[BackupItem]:
-    settings = get_settings()
-    backups = sorted(settings.database.backup_path.glob("*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
+def list_backups(admin: AuthedUser_MW, settings: SettingsDep) -> list[BackupItem]:
     return [
         BackupItem(
-            filename=p.name,
-            size_bytes=p.stat().st_size,
-            created_at=datetime.fromtimestamp(p.stat().st_mtime, tz=timezone.utc).isoformat(),
+            filename=name,
+            size_bytes=size,
+            created_at=datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
         )
-        for p in backups
+        for name, size, mtime in _list_backups(settings.database.backup_path)
     ]
 
 
@@ -155,28 +184,17 @@ def list_queue(
     per_page: int = Query(20, ge=1, le=100),
     queue_status: str | None = Query(None, alias="status"),
 ) -> QueueList:
-    qs = None
-    if queue_status:
-        try:
-            qs = QueueStatus(queue_status)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid status: {queue_status}")
+    qs = _STATUS_LOOKUP.get(queue_status) if queue_status else None
+    if queue_status and qs is None:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {queue_status}")
     rows, total = queue_repo.list_with_titles(page=page, per_page=per_page, status=qs)
-    items = [
-        QueueItem(
-            id=mq.id, tmdb_id=mq.tmdb_id, title=title, status=str(mq.status),
-            retries=mq.retries, message=mq.message, created_at=mq.created_at, updated_at=mq.updated_at,
-        )
-        for mq, title in rows
-    ]
+    items = queue_item_list_adapter.validate_python(rows, from_attributes=True)
     return QueueList(items=items, total=total, page=page, per_page=per_page)
 
 
 @router.post("/queue/refresh", summary="Refresh queue items")
 def refresh_queue(body: QueueRefreshRequest, admin: AuthedUser_MW, queue_repo: QueueRepoDep, session: DbSession) -> QueueRefreshResponse:
-    try:
-        target_status = QueueStatus(body.status)
-    except ValueError:
+    if (target_status := _STATUS_LOOKUP.get(body.status)) is None:
         raise HTTPException(status_code=400, detail=f"Invalid status: {body.status}")
     count = queue_repo.bulk_update_status(target_status, message=body.message, movie_ids=body.movie_ids)
     session.commit()
@@ -193,11 +211,10 @@ def retry_failed_queue(admin: AuthedUser_MW, queue_repo: QueueRepoDep, session:
 # ── System ────────────────────────────────────────────────────────────────
 
 @router.get("/stats", summary="Get system statistics")
-def get_stats(admin: AuthedUser_MW, movie_repo: MovieRepoDep, user_repo: UserRepoDep, queue_repo: QueueRepoDep) -> SystemStats:
-    settings = get_settings()
-    total_movies = movie_repo.count()
-    total_users = user_repo.count()
-    active_users = user_repo.count_active()
+def get_stats(
+    admin: AuthedUser_MW, stats_repo: StatsRepoDep, queue_repo: QueueRepoDep, settings: SettingsDep,
+) -> SystemStats:
+    total_movies, total_users, active_users = stats_repo.totals()
     queue_by_status = queue_repo.count_by_status()
     return SystemStats(
         total_movies=total_movies,
@@ -206,15 +223,14 @@ def get_stats(admin: AuthedUser_MW, movie_repo: MovieRepoDep, user_repo: UserRep
         disabled_users=total_users - active_users,
         total_queue=sum(queue_by_status.values()),
         queue_by_status=queue_by_status,
-        total_backups=len(list(settings.database.backup_path.glob("*.db"))),
+        total_backups=len(_list_backups(settings.database.backup_path)),
     )
 
 
 @router.get("/system-info", summary="Get detailed system information")
-def get_system_info(admin: AuthedUser_MW) -> SystemInfo:
+def get_system_info(admin: AuthedUser_MW, settings: SettingsDep) -> SystemInfo:
     from backend.infrastructure.scheduler import background_scheduler
 
-    settings = get_settings()
     db_size = 0
     try:
         db_size = settings.database.database_file.stat().st_size
@@ -306,7 +322,6 @@ def _validate_tmdb_key(api_key: str) -> bool:
 
 
 def _update_env_file(key: str, value: str) -> None:
-    from pathlib import Path
     env_path = Path(".env")
     if not env_path.exists():
         env_path.write_text(f"{key}={value}\n", encoding="utf-8")
@@ -330,8 +345,7 @@ def _update_env_file(key: str, value: str) -> None:
 
 
 @router.get("/tmdb-key", summary="Get current TMDB API key status")
-def get_tmdb_key(admin: AuthedUser_MW) -> TmdbKeyResponse:
-    settings = get_settings()
+def get_tmdb_key(admin: AuthedUser_MW, settings: SettingsDep) -> TmdbKeyResponse:
     key = settings.tmdb.tmdb_api_key
     is_placeholder = key in ("placeholder-tmdb-key", "your-tmdb-api-key", "")
     return TmdbKeyResponse(
@@ -341,7 +355,9 @@ def get_tmdb_key(admin: AuthedUser_MW) -> TmdbKeyResponse:
 
 
 @router.put("/tmdb-key", summary="Update TMDB API key")
-def update_tmdb_key(body: UpdateTmdbKeyRequest, admin: AuthedUser_MW, request: Request) -> TmdbKeyResponse:
+def update_tmdb_key(
+    body: UpdateTmdbKeyRequest, admin: AuthedUser_MW, request: Request, settings: SettingsDep,
+) -> TmdbKeyResponse:
     new_key = body.api_key.strip()
     if not new_key:
         raise HTTPException(status_code=400, detail="API key cannot be empty")
@@ -357,7 +373,7 @@ def update_tmdb_key(body: UpdateTmdbKeyRequest, admin: AuthedUser_MW, request: R
     _update_env_file("TMDB_API_KEY", new_key)
 
     from backend.infrastructure.external.tmdb_client import TMDBClient
-    request.app.state.tmdb_client = TMDBClient(new_key, get_settings().tmdb.tmdb_base_url)
+    request.app.state.tmdb_client = TMDBClient(new_key, settings.tmdb.tmdb_base_url, settings.tmdb.tmdb_concurrency)
 
     get_settings.cache_clear()
 
@@ -384,9 +400,9 @@ def validate_tmdb_key(body: UpdateTmdbKeyRequest, admin: AuthedUser_MW) -> TmdbK
 @router.get("/logs", summary="Get recent application logs")
 def get_logs(
     admin: AuthedUser_MW,
+    settings: SettingsDep,
     lines: int = Query(100, ge=1, le=1000, description="Number of lines to return"),
 ) -> LogsResponse:
-    settings = get_settings()
     log_file = settings.logging.log_file
     if not log_file.exists():
         return LogsResponse(lines=[], total_lines=0, log_file=str(log_file))
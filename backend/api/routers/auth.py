@@ -2,6 +2,7 @@ from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
 from backend.application.auth_service import (
@@ -18,22 +19,21 @@ router = APIRouter(prefix="/auth", tags=["security"])
 
 
 @router.post("/signup", summary="Create a new user")
-def signup(user: UserCreate, user_repo: UserRepoDep, session: DbSession) -> UserSchema:
-    new_user = create_user(user_repo, user.email, user.password)
-    session.commit()
-    session.refresh(new_user)
+async def signup(user: UserCreate, user_repo: UserRepoDep, session: DbSession) -> UserSchema:
+    new_user = await create_user(user_repo, user.email, user.password)
+    await run_in_threadpool(session.commit)
+    await run_in_threadpool(session.refresh, new_user)
     return new_user
 
 
 @router.post("/login", summary="Login for an access token")
-def login_for_access_token(
+async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     user_repo: UserRepoDep,
     settings: Settings = Depends(get_settings),
 ) -> ApiTokenSchema:
-    user = authenticate_user(user_repo, form_data.username, form_data.password)
-    user_scopes = user.get_scopes()
-    if any(scope not in user_scopes for scope in form_data.scopes):
+    user = await authenticate_user(user_repo, form_data.username, form_data.password)
+    if not user.scope_set.issuperset(form_data.scopes):
         raise InsufficientPermissionsError("Not enough permissions")
     access_token = generate_access_token(
         data={"sub": user.email, "scope": " ".join(form_data.scopes)},
@@ -4,7 +4,6 @@ from backend.api.deps import AuthedUser_MR, DbSession, MovieServiceDep, Recommen
 from backend.api.schemas.common import DetailResponse
 from backend.api.schemas.movie import MovieFilter, MovieSchema, MovieSearch
 from backend.domain.errors import NotFoundError
-from backend.infrastructure.db.models.user import MovieRecommendation
 
 router = APIRouter(prefix="/v2", tags=["v2"])
 
@@ -17,11 +16,10 @@ def get_movie_not_recommended_twice(
     movie_service: MovieServiceDep,
     rec_repo: RecommendationRepoDep,
 ) -> list[MovieSchema]:
-    exclude_tmdb_ids = [rec.tmdb_id for rec in user.recommendations]
-    movies = movie_service.search_excluding(movie_filter, exclude_tmdb_ids)
+    movies = movie_service.search_excluding(movie_filter, user.id)
     if not movies:
         raise NotFoundError()
-    rec_repo.add_all([MovieRecommendation(user_id=user.id, tmdb_id=movie.tmdb_id) for movie in movies])
+    rec_repo.add_for_user(user.id, [movie.tmdb_id for movie in movies])
     session.commit()
     return movies
 
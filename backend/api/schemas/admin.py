@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 
 
 class AdminUserItem(BaseModel):
@@ -17,6 +18,7 @@ class AdminUserList(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: int | None = None
 
 
 class UpdateScopesRequest(BaseModel):
@@ -37,6 +39,11 @@ class QueueItem(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @field_validator("status", mode="before")
+    @classmethod
+    def _status_value(cls, value: Any) -> str:
+        return str(value)
+
 
 class QueueList(BaseModel):
     items: list[QueueItem]
@@ -103,3 +110,7 @@ class TmdbKeyResponse(BaseModel):
 
 class UpdateTmdbKeyRequest(BaseModel):
     api_key: str
+
+
+admin_user_list_adapter = TypeAdapter(list[AdminUserItem])
+queue_item_list_adapter = TypeAdapter(list[QueueItem])
@@ -13,11 +13,6 @@ class UserBase(BaseModel):
     email: EmailStr
 
 
-class ValidateTokenData(UserBase):
-    scopes: list[str]
-    access_token_expires: datetime
-
-
 class UserCreate(UserBase):
     password: Annotated[str, StringConstraints(min_length=2, max_length=15, strip_whitespace=True)]
 
@@ -6,10 +6,13 @@ from pydantic import (
     ConfigDict,
     Field,
     TypeAdapter,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
 
+from backend.domain.policies import DEFAULT_RUNTIME_MIN, DEFAULT_VOTE_AVERAGE_MIN, DEFAULT_VOTE_COUNT_MIN
+
 
 class MovieSchema(BaseModel):
     """Response model for a movie stored in the database."""
@@ -35,6 +38,9 @@ class MovieSchema(BaseModel):
         if value is None or isinstance(value, date):
             return value
         try:
+            if isinstance(value, int):
+                # ChromaDB metadata stores release_date as an int YYYYMMDD; split it arithmetically.
+                return date(value // 10000, value // 100 % 100, value % 100)
             value = str(value)
             return date.fromisoformat(f"{value[:4]}-{value[4:6]}-{value[6:]}")
         except Exception:
@@ -53,10 +59,10 @@ class MovieFilter(BaseModel):
     title: Annotated[str | None, Field(description="Movie title.", examples=["WarGames"])] = None
     release_date_from: Annotated[date | None, Field(description="Earliest release date.", examples=["1999-01-01"])] = None
     release_date_to: Annotated[date | None, Field(description="Latest release date.", examples=["2005-12-31"])] = None
-    runtime_min: Annotated[int | None, Field(description="Min runtime.", examples=[90], gt=0)] = None
+    runtime_min: Annotated[int, Field(description="Min runtime.", examples=[90], gt=0)] = DEFAULT_RUNTIME_MIN
     runtime_max: Annotated[int | None, Field(description="Max runtime.", examples=[180], gt=0)] = None
-    vote_average_min: Annotated[float | None, Field(description="Min vote average.", examples=[6.5], ge=0, le=10)] = None
-    vote_count_min: Annotated[int | None, Field(description="Min vote count.", examples=[100], ge=0)] = None
+    vote_average_min: Annotated[float, Field(description="Min vote average.", examples=[6.5], ge=0, le=10)] = DEFAULT_VOTE_AVERAGE_MIN
+    vote_count_min: Annotated[int, Field(description="Min vote count.", examples=[100], ge=0)] = DEFAULT_VOTE_COUNT_MIN
     popularity_min: Annotated[float | None, Field(description="Min popularity.", examples=[10.0], ge=0)] = None
     genres: Annotated[list[str], Field(description="Genres.", examples=[["Thriller"]], default_factory=list)]
     production_countries: Annotated[list[str], Field(description="Countries.", examples=[["United States"]], default_factory=list)]
@@ -64,12 +70,16 @@ class MovieFilter(BaseModel):
     spoken_languages: Annotated[list[str], Field(description="Languages.", examples=[["English"]], default_factory=list)]
     cast: Annotated[list[str], Field(description="Actors.", examples=[["Brad Pitt"]], default_factory=list)]
 
+    @field_validator("runtime_min", "vote_average_min", "vote_count_min", mode="before")
+    @classmethod
+    def _default_null_thresholds(cls, value: Any, info: ValidationInfo) -> Any:
+        # Clients may send an explicit null for "no preference"; it means the default, not "no threshold".
+        return cls.model_fields[info.field_name].default if value is None else value
+
     @model_validator(mode="after")
     def _check_instance_has_any_filters(self) -> Self:
-        movie_filters = self.model_dump(exclude_unset=True)
-        if not movie_filters:
+        if not self.model_fields_set - {"n_results"}:
             raise ValueError("At least one filter must be provided to search for movies.")
-        movie_filters.pop("n_results", None)
         return self
 
 
@@ -1,7 +1,7 @@
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -18,6 +18,16 @@ from .infrastructure.vector.chroma_store import ChromaVectorStore
 
 logger = get_logger(__name__)
 
+STATIC_DIR = Path(__file__).parent / "static" / "html"
+_INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+
+
+class CachedStaticFiles(StaticFiles):
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=86400"
+        return response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,7 +40,7 @@ async def lifespan(app: FastAPI):
     app.state.session_factory = session_factory
 
     app.state.tmdb_client = TMDBClient(
-        settings.tmdb.tmdb_api_key, settings.tmdb.tmdb_base_url,
+        settings.tmdb.tmdb_api_key, settings.tmdb.tmdb_base_url, settings.tmdb.tmdb_concurrency,
     )
 
     vector_store = ChromaVectorStore(
@@ -38,6 +48,8 @@ async def lifespan(app: FastAPI):
         settings.embedding.embedding_model,
         settings.embedding.use_cuda,
     )
+    # Load the embedding model at boot rather than on the first search or scheduler tick.
+    vector_store.initialize()
     app.state.vector_store = vector_store
 
     start_scheduler()
@@ -52,14 +64,12 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan)
 
 
-def get_cors_origins() -> list[str]:
-    settings = get_settings()
-    return settings.security.cors_origins
-
+# CORSMiddleware only tests membership (`origin in allow_origins`), so a frozenset makes each check O(1).
+CORS_ORIGINS: frozenset[str] = frozenset(get_settings().security.cors_origins)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_cors_origins(),
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -68,6 +78,11 @@ app.add_middleware(
 register_error_handlers(app)
 
 
+@app.get("/", include_in_schema=False)
+async def index() -> Response:
+    return Response(_INDEX_HTML, media_type="text/html", headers={"Cache-Control": "public, max-age=300"})
+
+
 @app.get("/api/health", tags=["health"])
 def health_check() -> HealthResponse:
     return HealthResponse(status="ok")
@@ -76,4 +91,4 @@ def health_check() -> HealthResponse:
 for router in all_routers:
     app.include_router(router)
 
-app.mount("/", StaticFiles(directory=Path(__file__).parent / "static" / "html", html=True), name="Request Builder")
+app.mount("/img", CachedStaticFiles(directory=STATIC_DIR / "img"), name="Request Builder assets")
@@ -1,8 +1,15 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 import bcrypt
 import jwt
+from fastapi.concurrency import run_in_threadpool
+from jwt.exceptions import ExpiredSignatureError
 from jwt.exceptions import InvalidTokenError as JWTInvalidTokenError
 from pydantic import ValidationError
 
@@ -18,6 +25,14 @@ from backend.infrastructure.db.repositories.user import UserRepository
 
 logger = get_logger(__name__)
 
+_jwt = jwt.PyJWT(options={"require": ["exp", "sub"]})
+
+DECODED_TOKEN_CACHE_SIZE = 4096
+
+# bcrypt is CPU-bound; keep it off the shared threadpool that also serves DB-bound endpoints.
+# Only the hashing runs here: repository calls stay on the regular threadpool.
+_password_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
 
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
@@ -28,6 +43,14 @@ def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_password_pool, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(_password_pool, verify_password, password, hashed_password)
+
+
 def generate_access_token(
     data: dict[str, str],
     secret_key: str,
@@ -39,20 +62,25 @@ def generate_access_token(
     return jwt.encode(to_encode, secret_key, algorithm=algorithm)
 
 
-def authenticate_user(user_repo: UserRepository, email: str, password: str) -> User:
-    user = user_repo.find_by_email(email)
-    if not user or not verify_password(password, user.hashed_password):
+async def authenticate_user(user_repo: UserRepository, email: str, password: str) -> User:
+    user = await run_in_threadpool(user_repo.find_by_email, email)
+    if not user or not await verify_password_async(password, user.hashed_password):
         raise InvalidCredentialsError("Incorrect email or password")
     if user.disabled:
         raise UserDisabledError()
     return user
 
 
-def create_user(user_repo: UserRepository, email: str, password: str) -> User:
-    if user_repo.find_by_email(email):
+async def create_user(user_repo: UserRepository, email: str, password: str) -> User:
+    if await run_in_threadpool(user_repo.find_by_email, email):
         raise UserAlreadyExistsError("Email already registered")
-    user = User(email=email, hashed_password=hash_password(password))
-    return user_repo.add(user)
+    user = User(email=email, hashed_password=await hash_password_async(password))
+    return await run_in_threadpool(user_repo.add, user)
+
+
+@lru_cache(maxsize=DECODED_TOKEN_CACHE_SIZE)
+def _decode_verified(token: str, secret_key: str, algorithm: str) -> dict[str, Any]:
+    return _jwt.decode(token, secret_key, algorithms=[algorithm])
 
 
 def decode_access_token(
@@ -61,8 +89,11 @@ def decode_access_token(
     algorithm: str = "HS256",
 ) -> dict[str, Any]:
     try:
-        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
-        return payload
+        payload = _decode_verified(token, secret_key, algorithm)
+        # The signature only needs verifying once per token, but expiry must be re-checked on every hit.
+        if payload["exp"] <= time.time():
+            raise ExpiredSignatureError("Signature has expired")
+        return dict(payload)
     except (JWTInvalidTokenError, ValidationError) as e:
         logger.warning(f"JWT validation failed: {e}")
         raise InvalidTokenError("Could not validate credentials")
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 from fastapi import HTTPException
 
 from backend.core.logging import get_logger
+from backend.domain.policies import DEFAULT_RUNTIME_MIN, DEFAULT_VOTE_AVERAGE_MIN, DEFAULT_VOTE_COUNT_MIN
 from backend.infrastructure.db.models.movie import Movie
 from backend.infrastructure.db.repositories.movie import MovieRepository
 from backend.infrastructure.vector.chroma_store import ChromaVectorStore
@@ -14,6 +15,14 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+PREFILTER_ID_LIMIT_MIN = 1000
+PREFILTER_IDS_PER_RESULT = 50
+
+# Shared ChromaDB conditions for the defaults; most queries don't override them.
+_DEFAULT_VOTE_AVERAGE_COND = {"vote_average": {"$gte": DEFAULT_VOTE_AVERAGE_MIN}}
+_DEFAULT_VOTE_COUNT_COND = {"vote_count": {"$gt": DEFAULT_VOTE_COUNT_MIN}}
+_DEFAULT_RUNTIME_COND = {"runtime": {"$gte": DEFAULT_RUNTIME_MIN}}
+
 
 class MovieQueryService:
     def __init__(self, movie_repo: MovieRepository, vector_store: ChromaVectorStore | None = None):
@@ -23,47 +32,40 @@ class MovieQueryService:
     def search(self, filters: MovieFilter, limit: int = 1) -> list[Movie] | list[dict[str, Any]]:
         """Search for movies. Returns list[Movie] for SQL path, list[dict] for ChromaDB path."""
         if filters.description:
-            where, where_doc = self._build_chromadb_filters(filters)
+            where, where_doc = self._build_chromadb_filters(filters, k=limit)
             return self._vector_store.query(filters.description, where, where_doc, k=limit)
-        return self._movie_repo.search(
-            title=filters.title,
-            release_date_from=filters.release_date_from,
-            release_date_to=filters.release_date_to,
-            runtime_min=filters.runtime_min or 70,
-            runtime_max=filters.runtime_max,
-            vote_average_min=filters.vote_average_min or 6.4,
-            vote_count_min=filters.vote_count_min or 50,
-            popularity_min=filters.popularity_min,
-            genres=filters.genres or None,
-            production_countries=filters.production_countries or None,
-            keywords=filters.keywords or None,
-            spoken_languages=filters.spoken_languages or None,
-            cast=filters.cast or None,
-            limit=limit,
-        )
+        return self._search_sql(filters, limit)
 
     def search_excluding(
         self,
         filters: MovieFilter,
-        exclude_tmdb_ids: list[int] | None,
+        user_id: int,
         limit: int = 1,
     ) -> list[Movie] | list[MovieSchema]:
-        """Search excluding already-recommended movies. Same return type logic as search()."""
+        """Search excluding movies already recommended to the user. Same return type logic as search()."""
         if filters.description:
-            where, where_doc = self._build_chromadb_filters(filters, exclude_tmdb_ids)
+            exclude_tmdb_ids = self._movie_repo.find_recommended_tmdb_ids(user_id)
+            where, where_doc = self._build_chromadb_filters(
+                filters, exclude_tmdb_ids, k=limit, exclude_recommended_for=user_id,
+            )
             raw = self._vector_store.query(filters.description, where, where_doc, k=limit)
             from backend.api.schemas.movie import movie_schema_list_adapter
 
             return movie_schema_list_adapter.validate_python(raw)
+        return self._search_sql(filters, limit, exclude_recommended_for=user_id)
+
+    def _search_sql(
+        self, filters: MovieFilter, limit: int, exclude_recommended_for: int | None = None,
+    ) -> list[Movie]:
         return self._movie_repo.search(
-            exclude_tmdb_ids=exclude_tmdb_ids,
+            exclude_recommended_for=exclude_recommended_for,
             title=filters.title,
             release_date_from=filters.release_date_from,
             release_date_to=filters.release_date_to,
-            runtime_min=filters.runtime_min or 70,
+            runtime_min=filters.runtime_min,
             runtime_max=filters.runtime_max,
-            vote_average_min=filters.vote_average_min or 6.4,
-            vote_count_min=filters.vote_count_min or 50,
+            vote_average_min=filters.vote_average_min,
+            vote_count_min=filters.vote_count_min,
             popularity_min=filters.popularity_min,
             genres=filters.genres or None,
             production_countries=filters.production_countries or None,
@@ -77,13 +79,26 @@ class MovieQueryService:
         self,
         filters: MovieFilter,
         exclude_tmdb_ids: list[int] | None = None,
-        vote_average_min: float = 6.4,
-        vote_count_min: int = 50,
-        runtime_min: int = 70,
+        k: int = 1,
+        exclude_recommended_for: int | None = None,
     ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
         meta: list[dict[str, Any]] = []
         if filters.title or filters.cast:
-            tmdb_ids = self._movie_repo.find_tmdb_ids_by_filters(filters.title, filters.cast)
+            # Over-retrieve the best-scored candidates rather than shipping every match into the $in list.
+            # The cap only holds up if every SQL-expressible filter is applied before it.
+            tmdb_ids = self._movie_repo.find_tmdb_ids_by_filters(
+                filters.title,
+                filters.cast,
+                limit=max(PREFILTER_ID_LIMIT_MIN, k * PREFILTER_IDS_PER_RESULT),
+                exclude_recommended_for=exclude_recommended_for,
+                release_date_from=filters.release_date_from,
+                release_date_to=filters.release_date_to,
+                runtime_min=filters.runtime_min,
+                runtime_max=filters.runtime_max,
+                vote_average_min=filters.vote_average_min,
+                vote_count_min=filters.vote_count_min,
+                popularity_min=filters.popularity_min,
+            )
             if tmdb_ids:
                 meta.append({"tmdb_id": {"$in": tmdb_ids}})
             else:
@@ -91,9 +106,18 @@ class MovieQueryService:
 
         if exclude_tmdb_ids:
             meta.append({"tmdb_id": {"$nin": exclude_tmdb_ids}})
-        meta.append({"vote_average": {"$gte": filters.vote_average_min or vote_average_min}})
-        meta.append({"vote_count": {"$gt": filters.vote_count_min or vote_count_min}})
-        meta.append({"runtime": {"$gte": filters.runtime_min or runtime_min}})
+        meta.append(
+            _DEFAULT_VOTE_AVERAGE_COND if filters.vote_average_min == DEFAULT_VOTE_AVERAGE_MIN
+            else {"vote_average": {"$gte": filters.vote_average_min}}
+        )
+        meta.append(
+            _DEFAULT_VOTE_COUNT_COND if filters.vote_count_min == DEFAULT_VOTE_COUNT_MIN
+            else {"vote_count": {"$gt": filters.vote_count_min}}
+        )
+        meta.append(
+            _DEFAULT_RUNTIME_COND if filters.runtime_min == DEFAULT_RUNTIME_MIN
+            else {"runtime": {"$gte": filters.runtime_min}}
+        )
         if filters.release_date_from:
             meta.append({"release_date": {"$gte": int(filters.release_date_from.strftime("%Y%m%d"))}})
         if filters.release_date_to:
@@ -1,29 +1,36 @@
 import logging
+from functools import lru_cache
 
 from .settings import get_settings
 
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] | %(levelname)-7s | %(name)s %(funcName)s() | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-def get_logger(name: str) -> logging.Logger:
+
+@lru_cache
+def _get_handlers() -> tuple[int, logging.Handler, logging.Handler]:
+    """Build the console and file handlers once; every module logger shares them (one fd for the log file)."""
     settings = get_settings()
     log_level = getattr(logging, settings.logging.log_level, logging.INFO)
-    log_file = settings.logging.log_file
+
+    file_handler = logging.FileHandler(settings.logging.log_file)
+    console_handler = logging.StreamHandler()
+    file_handler.setLevel(logging.WARNING)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(_FORMATTER)
+    file_handler.setFormatter(_FORMATTER)
+    return log_level, console_handler, file_handler
+
+
+def get_logger(name: str) -> logging.Logger:
+    log_level, console_handler, file_handler = _get_handlers()
 
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
     if not logger.handlers:
-        file_handler = logging.FileHandler(log_file)
-        console_handler = logging.StreamHandler()
-        file_handler.setLevel(logging.WARNING)
-        console_handler.setLevel(log_level)
-
-        formatter = logging.Formatter(
-            "[%(asctime)s] | %(levelname)-7s | %(name)s %(funcName)s() | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
-
         logger.addHandler(console_handler)
         logger.addHandler(file_handler)
 
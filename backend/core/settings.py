@@ -8,6 +8,13 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache
+def _ensure_dir(path: Path) -> Path:
+    # Settings are constructed repeatedly (tests, workers), but each directory only needs creating once.
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 class SecuritySettings(BaseSettings):
     secret_key: str = Field(..., min_length=32)
     access_token_expire_days: int = Field(default=7, gt=0)
@@ -26,23 +33,20 @@ class DatabaseSettings(BaseSettings):
     backup_path: Path = Path(__file__).parent.parent.parent / "data" / "db" / "backups"
     populate_db_path: Path = Path(__file__).parent.parent.parent / "data" / "populate_db"
 
-    @field_validator("database_path", mode="before")
+    @field_validator("database_path", mode="after")
     @classmethod
     def ensure_database_path_exists(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        return _ensure_dir(v)
 
-    @field_validator("backup_path", mode="before")
+    @field_validator("backup_path", mode="after")
     @classmethod
     def ensure_backup_path_exists(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        return _ensure_dir(v)
 
-    @field_validator("populate_db_path", mode="before")
+    @field_validator("populate_db_path", mode="after")
     @classmethod
     def ensure_populate_db_path_exists(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        return _ensure_dir(v)
 
     @property
     def database_url(self) -> str:
@@ -58,6 +62,7 @@ class DatabaseSettings(BaseSettings):
 class TMDBSettings(BaseSettings):
     tmdb_api_key: str = Field(...)
     tmdb_base_url: str = Field(default="https://api.themoviedb.org/3")
+    tmdb_concurrency: int = Field(default=16, gt=0)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore")
 
@@ -68,11 +73,10 @@ class EmbeddingSettings(BaseSettings):
     use_cuda: bool = Field(default=False)
     embedding_batch_size: int = Field(default=5460, gt=0)
 
-    @field_validator("vector_store_path", mode="before")
+    @field_validator("vector_store_path", mode="after")
     @classmethod
     def ensure_vector_store_path_exists(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        return _ensure_dir(v)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore")
 
@@ -81,11 +85,10 @@ class LoggingSettings(BaseSettings):
     log_level: str = Field(default="INFO")
     log_dir: Path = Path(__file__).parent.parent.parent / "logs"
 
-    @field_validator("log_dir", mode="before")
+    @field_validator("log_dir", mode="after")
     @classmethod
     def ensure_log_dir_exists(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        return _ensure_dir(v)
 
     @field_validator("log_level")
     @classmethod
@@ -1,13 +1,32 @@
 ALLOWED_LANGUAGES = frozenset({"english", "turkish", "swedish"})
 EXCLUDED_SOLO_GENRES = frozenset({"documentary", "music"})
+# TMDB genre ids of EXCLUDED_SOLO_GENRES (Documentary, Music), as returned in list-endpoint `genre_ids`.
+EXCLUDED_SOLO_GENRE_IDS = frozenset({99, 10402})
+# Search thresholds applied when a filter leaves them unset.
+DEFAULT_VOTE_AVERAGE_MIN = 6.4
+DEFAULT_VOTE_COUNT_MIN = 50
+DEFAULT_RUNTIME_MIN = 70
 
 
 def is_acceptable_movie(genres: str | None, spoken_languages: str | None) -> bool:
     if not genres or not spoken_languages:
         return False
-    langs = spoken_languages.lower().split(", ")
-    genre_list = genres.lower().split(", ")
-    has_allowed_lang = any(lang in ALLOWED_LANGUAGES for lang in langs)
-    is_not_documentary_or_music = genre_list != ["documentary"] and genre_list != ["music"]
-    has_not_documentary_and_music = not ("documentary" in genre_list and "music" in genre_list)
-    return has_allowed_lang and is_not_documentary_or_music and has_not_documentary_and_music
+    if ALLOWED_LANGUAGES.isdisjoint(spoken_languages.lower().split(", ")):
+        return False
+    genre_set = frozenset(genres.lower().split(", "))
+    # Reject pure documentary/music titles and anything that is both a documentary and a music film.
+    return not (genre_set <= EXCLUDED_SOLO_GENRES or EXCLUDED_SOLO_GENRES <= genre_set)
+
+
+def is_acceptable_prefilter(genre_ids: list[int] | None) -> bool:
+    """Cheap genre-only check on list-endpoint data; `None` means unknown and is left to is_acceptable_movie.
+
+    Languages are not prefiltered: listings only carry `original_language`, while the policy
+    accepts any movie whose *spoken* languages include an allowed one.
+    """
+    if genre_ids is None:
+        return True
+    if not genre_ids:
+        return False
+    genre_set = frozenset(genre_ids)
+    return not (genre_set <= EXCLUDED_SOLO_GENRE_IDS or EXCLUDED_SOLO_GENRE_IDS <= genre_set)
@@ -7,7 +7,7 @@ from backend.core.logging import get_logger
 logger = get_logger(__name__)
 
 
-def backup_db(database_file: Path, backup_path: Path) -> None:
+def backup_db(database_file: Path, backup_path: Path) -> Path:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_filename = f"movies_backup_{timestamp}.db"
     destination_path = backup_path / backup_filename
@@ -21,3 +21,4 @@ def backup_db(database_file: Path, backup_path: Path) -> None:
     finally:
         source_connection.close()
         destination_connection.close()
+    return destination_path
@@ -1,4 +1,4 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from .queue import MovieQueue
     from .user import MovieRecommendation
 
-from sqlalchemy import Date, DateTime, Float, Integer, String, Text, event, func
+from sqlalchemy import Date, DateTime, Float, Index, Integer, String, Text, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import Base
@@ -40,73 +40,78 @@ class Movie(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     tmdb_id: Mapped[int] = mapped_column(Integer, unique=True, index=True)
 
-    title: Mapped[str] = mapped_column(String, index=True)
+    title: Mapped[str] = mapped_column(String)
     status: Mapped[str | None] = mapped_column(String)
     release_date: Mapped[date | None] = mapped_column(Date, index=True)
     poster_path: Mapped[str | None] = mapped_column(String)
 
-    runtime: Mapped[int | None] = mapped_column(Integer, index=True)
-    vote_average: Mapped[float | None] = mapped_column(Float, index=True)
-    vote_count: Mapped[int | None] = mapped_column(Integer, index=True)
-    popularity: Mapped[float | None] = mapped_column(Float, index=True)
+    runtime: Mapped[int | None] = mapped_column(Integer)
+    vote_average: Mapped[float | None] = mapped_column(Float)
+    vote_count: Mapped[int | None] = mapped_column(Integer)
+    popularity: Mapped[float | None] = mapped_column(Float)
 
     overview: Mapped[str | None] = mapped_column(Text)
     tagline: Mapped[str | None] = mapped_column(Text)
 
-    genres: Mapped[str | None] = mapped_column(String, index=True)
-    spoken_languages: Mapped[str | None] = mapped_column(String, index=True)
+    genres: Mapped[str | None] = mapped_column(String)
+    spoken_languages: Mapped[str | None] = mapped_column(String)
     production_companies: Mapped[str | None] = mapped_column(String)
-    production_countries: Mapped[str | None] = mapped_column(String, index=True)
-    keywords: Mapped[str | None] = mapped_column(String, index=True)
+    production_countries: Mapped[str | None] = mapped_column(String)
+    keywords: Mapped[str | None] = mapped_column(String)
     cast: Mapped[str | None] = mapped_column(String)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
     recommendations: Mapped[list["MovieRecommendation"]] = relationship(
         back_populates="movie", cascade="all, delete-orphan", lazy="selectin"
     )
     movie_queue: Mapped["MovieQueue"] = relationship(back_populates="movie", cascade="all, delete-orphan")
 
-    def update(self, validated_movie: "TMDBMovieData") -> bool:
-        changed = False
+    def diff(self, validated_movie: "TMDBMovieData") -> dict[str, Any]:
+        """Columns whose fresh TMDB value is set and differs from the stored one; the movie itself is not modified."""
+        changes: dict[str, Any] = {}
         for col in SELECTED_MOVIE_COLUMNS:
             old_value = getattr(self, col)
             new_value = getattr(validated_movie, col)
             if new_value and old_value != new_value:
-                setattr(self, col, new_value)
-                if not changed:
-                    changed = True
+                changes[col] = new_value
                 logger.warning(f"Updated movie tmdb_id '{self.tmdb_id}' field '{col}' from '{old_value}' to '{new_value}'")
-        return changed
+        return changes
 
     def get_description_metadata(self) -> str:
         return " ".join(
-            map(
-                str.lower,
+            filter(
+                None,
                 (
-                    self.overview or "",
-                    self.tagline or "",
-                    self.keywords or "",
-                    self.genres or "",
-                    self.production_companies or "",
-                    self.production_countries or "",
-                    self.spoken_languages or "",
+                    self.overview,
+                    self.tagline,
+                    self.keywords,
+                    self.genres,
+                    self.production_companies,
+                    self.production_countries,
+                    self.spoken_languages,
                 ),
             )
-        )
+        ).lower()
 
     def get_description(self) -> str:
-        fields = {
-            "Overview": self.overview.rstrip(".?!") if self.overview else None,
-            "Tagline": self.tagline.rstrip(".?!") if self.tagline else None,
-            "Keywords": self.keywords,
-            "Genres": self.genres,
-            "Production Companies": self.production_companies,
-            "Production Countries": self.production_countries,
-            "Spoken Languages": self.spoken_languages,
-        }
-        return ". ".join(f"{label}: {value}" for label, value in fields.items() if value)
+        parts: list[str] = []
+        if self.overview:
+            parts.append(f"Overview: {self.overview.rstrip('.?!')}")
+        if self.tagline:
+            parts.append(f"Tagline: {self.tagline.rstrip('.?!')}")
+        if self.keywords:
+            parts.append(f"Keywords: {self.keywords}")
+        if self.genres:
+            parts.append(f"Genres: {self.genres}")
+        if self.production_companies:
+            parts.append(f"Production Companies: {self.production_companies}")
+        if self.production_countries:
+            parts.append(f"Production Countries: {self.production_countries}")
+        if self.spoken_languages:
+            parts.append(f"Spoken Languages: {self.spoken_languages}")
+        return ". ".join(parts)
 
     def get_metadata(self) -> dict[str, Any]:
         metadata: dict[str, Any] = {
@@ -134,6 +139,9 @@ class Movie(Base):
         return f"<Movie(id={self.tmdb_id}, title={self.title!r})>"
 
 
-@event.listens_for(Movie, "before_update")
-def movie_trigger(mapper: Any, connection: Any, movie: Movie) -> None:
-    movie.updated_at = datetime.now(timezone.utc)
+# Bayesian-style average: damps the rating of movies with few votes. The 100 is a literal
+# (not a bound parameter) so queries render the exact expression ix_movies_weighted_score indexes.
+WEIGHTED_SCORE = (Movie.vote_average * Movie.vote_count) / (Movie.vote_count + literal_column("100"))
+
+Index("ix_movies_weighted_score", WEIGHTED_SCORE.desc(), Movie.vote_count.desc(), Movie.popularity.desc())
+
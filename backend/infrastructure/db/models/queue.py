@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum as PythonEnum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, event, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, func
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,27 +27,30 @@ class QueueStatus(PythonEnum):
 
 class MovieQueue(Base):
     __tablename__ = "movie_queues"
+    # Both status composites lead with status, so a standalone status index would be redundant.
+    # The unfiltered admin listing walks (updated_at, id) backwards: SQLite sorts NULLs lowest, so a
+    # reverse scan already yields "updated_at DESC NULLS LAST, id DESC" without a sort.
+    __table_args__ = (
+        Index("ix_movie_queues_status_updated_at_id", "status", "updated_at", "id"),
+        Index("ix_movie_queues_status_created_at", "status", "created_at"),
+        Index("ix_movie_queues_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tmdb_id: Mapped[int] = mapped_column(Integer, ForeignKey("movies.tmdb_id"), unique=True, index=True)
     status: Mapped[QueueStatus] = mapped_column(
         SqlEnum(QueueStatus, native_enum=False),
         default=QueueStatus.PREPROCESS_DESCRIPTION,
-        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime, onupdate=func.now())
     retries: Mapped[int] = mapped_column(Integer, default=0)
     message: Mapped[str | None] = mapped_column(Text)
 
     preprocessed_description: Mapped[str | None] = mapped_column(Text)
 
-    movie: Mapped["Movie"] = relationship(back_populates="movie_queue")
+    movie: Mapped["Movie"] = relationship(back_populates="movie_queue", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<DescQueue(status={self.status!r}, movie_tmdb_id={self.tmdb_id})>"
 
-
-@event.listens_for(MovieQueue, "before_update")
-def desc_trigger(mapper: Any, connection: Any, movie_queue: MovieQueue) -> None:
-    movie_queue.updated_at = datetime.now(timezone.utc)
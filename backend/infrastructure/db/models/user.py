@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import Base
@@ -17,7 +17,7 @@ class User(Base):
     scopes: Mapped[str] = mapped_column(String, default="movie:read")
 
     recommendations: Mapped[list["MovieRecommendation"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
 
     def __repr__(self) -> str:
@@ -28,8 +28,12 @@ class User(Base):
         self.access_token_scopes: list[str] | None = None
         self.access_token_expires: datetime | None = None
 
-    def get_scopes(self) -> list[str]:
-        return self.scopes.split(" ")
+    @property
+    def scope_set(self) -> frozenset[str]:
+        return frozenset(self.scopes.split(" "))
+
+
+Index("ix_users_email_lower", func.lower(User.email))
 
 
 class MovieRecommendation(Base):
@@ -1,6 +1,7 @@
 from .movie import MovieRepository
 from .queue import QueueRepository
 from .recommendation import RecommendationRepository
+from .stats import StatsRepository
 from .user import UserRepository
 
-__all__ = ["MovieRepository", "QueueRepository", "RecommendationRepository", "UserRepository"]
+__all__ = ["MovieRepository", "QueueRepository", "RecommendationRepository", "StatsRepository", "UserRepository"]
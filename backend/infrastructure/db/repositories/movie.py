@@ -1,11 +1,14 @@
 from datetime import date
 from typing import Any
 
-from sqlalchemy import Select, and_, func, select
+from sqlalchemy import Select, and_, select, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from ..base import Base
-from ..models.movie import Movie
+from ..models.movie import WEIGHTED_SCORE, Movie
+from ..models.queue import MovieQueue
+from ..models.user import MovieRecommendation
 
 
 class MovieRepository:
@@ -22,22 +25,51 @@ class MovieRepository:
     def find_tmdb_ids_in_db(self, tmdb_ids: set[int]) -> list[int]:
         return self._session.execute(select(Movie.tmdb_id).where(Movie.tmdb_id.in_(tmdb_ids))).scalars().all()
 
+    def find_recommended_tmdb_ids(self, user_id: int) -> list[int]:
+        return self._session.execute(
+            select(MovieRecommendation.tmdb_id).where(MovieRecommendation.user_id == user_id)
+        ).scalars().all()
+
     def find_tmdb_ids_by_filters(
         self,
         title: str | None = None,
         cast: list[str] | None = None,
+        limit: int | None = None,
+        *,
+        exclude_recommended_for: int | None = None,
+        release_date_from: date | None = None,
+        release_date_to: date | None = None,
+        runtime_min: int | None = None,
+        runtime_max: int | None = None,
+        vote_average_min: float | None = None,
+        vote_count_min: int | None = None,
+        popularity_min: float | None = None,
     ) -> list[int]:
-        q = select(Movie.tmdb_id)
+        # The range filters and the exclusion must apply before LIMIT, or the top-scored IDs kept by the
+        # cap could all be ones the caller filters out afterwards.
+        q = self._apply_range_filters(
+            select(Movie.tmdb_id),
+            exclude_recommended_for=exclude_recommended_for,
+            release_date_from=release_date_from,
+            release_date_to=release_date_to,
+            runtime_min=runtime_min,
+            runtime_max=runtime_max,
+            vote_average_min=vote_average_min,
+            vote_count_min=vote_count_min,
+            popularity_min=popularity_min,
+        )
         if title:
             q = q.where(Movie.title.icontains(title))
         if cast:
             q = self._apply_list_filter(q, Movie.cast, cast)
+        if limit is not None:
+            q = q.order_by(WEIGHTED_SCORE.desc()).limit(limit)
         return self._session.execute(q).scalars().all()
 
     def search(
         self,
         *,
-        exclude_tmdb_ids: list[int] | None = None,
+        exclude_recommended_for: int | None = None,
         title: str | None = None,
         release_date_from: date | None = None,
         release_date_to: date | None = None,
@@ -53,30 +85,25 @@ class MovieRepository:
         cast: list[str] | None = None,
         limit: int = 1,
     ) -> list[Movie]:
-        q = (
+        q = self._apply_range_filters(
             select(Movie)
-            .where(Movie.vote_count > vote_count_min)
             .order_by(
-                ((Movie.vote_average * Movie.vote_count) / (Movie.vote_count + 100)).desc(),
+                WEIGHTED_SCORE.desc(),
                 Movie.vote_count.desc(),
                 Movie.popularity.desc(),
             )
-            .limit(limit)
+            .limit(limit),
+            exclude_recommended_for=exclude_recommended_for,
+            release_date_from=release_date_from,
+            release_date_to=release_date_to,
+            runtime_min=runtime_min,
+            runtime_max=runtime_max,
+            vote_average_min=vote_average_min,
+            vote_count_min=vote_count_min,
+            popularity_min=popularity_min,
         )
-        if exclude_tmdb_ids:
-            q = q.where(Movie.tmdb_id.not_in(exclude_tmdb_ids))
         if title:
             q = q.where(Movie.title.icontains(title))
-        if release_date_from:
-            q = q.where(Movie.release_date >= release_date_from)
-        if release_date_to:
-            q = q.where(Movie.release_date <= release_date_to)
-        q = q.where(Movie.runtime >= runtime_min)
-        if runtime_max:
-            q = q.where(Movie.runtime <= runtime_max)
-        q = q.where(Movie.vote_average >= vote_average_min)
-        if popularity_min:
-            q = q.where(Movie.popularity >= popularity_min)
         for attr, vals in [
             (Movie.genres, genres),
             (Movie.production_countries, production_countries),
@@ -91,11 +118,64 @@ class MovieRepository:
     def add(self, entity: Base) -> None:
         self._session.add(entity)
 
-    def add_all(self, entities: list[Any]) -> None:
-        self._session.add_all(entities)
+    def add_many_with_queue(self, movie_rows: list[dict[str, Any]]) -> int:
+        """Insert movies and their queue entries as two executemany statements, bypassing the unit of work.
 
-    def count(self) -> int:
-        return self._session.execute(select(func.count(Movie.id))).scalar() or 0
+        Rows whose tmdb_id already exists (e.g. added concurrently by populate_db) are skipped rather than
+        failing the batch; returns the number of movies actually inserted.
+        """
+        if not movie_rows:
+            return 0
+        inserted_ids = self._session.execute(
+            insert(Movie).on_conflict_do_nothing(index_elements=["tmdb_id"]).returning(Movie.tmdb_id), movie_rows
+        ).scalars().all()
+        if inserted_ids:
+            self._session.execute(
+                insert(MovieQueue).on_conflict_do_nothing(index_elements=["tmdb_id"]),
+                [{"tmdb_id": tmdb_id} for tmdb_id in inserted_ids],
+            )
+        return len(inserted_ids)
+
+    def bulk_update(self, changed_rows: list[dict[str, Any]]) -> None:
+        """ORM bulk UPDATE by primary key; each row holds "id" plus only the columns that changed."""
+        if not changed_rows:
+            return
+        self._session.execute(update(Movie), changed_rows)
+
+    @staticmethod
+    def _apply_range_filters(
+        query: Select,
+        *,
+        exclude_recommended_for: int | None,
+        release_date_from: date | None,
+        release_date_to: date | None,
+        runtime_min: int | None,
+        runtime_max: int | None,
+        vote_average_min: float | None,
+        vote_count_min: int | None,
+        popularity_min: float | None,
+    ) -> Select:
+        if vote_count_min is not None:
+            query = query.where(Movie.vote_count > vote_count_min)
+        if exclude_recommended_for is not None:
+            query = query.where(
+                Movie.tmdb_id.not_in(
+                    select(MovieRecommendation.tmdb_id).where(MovieRecommendation.user_id == exclude_recommended_for)
+                )
+            )
+        if release_date_from:
+            query = query.where(Movie.release_date >= release_date_from)
+        if release_date_to:
+            query = query.where(Movie.release_date <= release_date_to)
+        if runtime_min is not None:
+            query = query.where(Movie.runtime >= runtime_min)
+        if runtime_max:
+            query = query.where(Movie.runtime <= runtime_max)
+        if vote_average_min is not None:
+            query = query.where(Movie.vote_average >= vote_average_min)
+        if popularity_min:
+            query = query.where(Movie.popularity >= popularity_min)
+        return query
 
     @staticmethod
     def _apply_list_filter(
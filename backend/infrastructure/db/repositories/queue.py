@@ -1,35 +1,59 @@
-from datetime import datetime, timezone
-
-
-from sqlalchemy import Row, func, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, func, insert, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from ..models.movie import Movie
 from ..models.queue import MovieQueue, QueueStatus
 
+# SQLite builds before 3.32 allow only 999 bound parameters per statement. Each chunked UPDATE binds
+# the IN list plus status, message, retries and the onupdate updated_at, so leave headroom for those.
+IN_CLAUSE_CHUNK_SIZE = 900
+
+_FIND_BY_STATUS = (
+    select(MovieQueue).where(MovieQueue.status == bindparam("status")).order_by(MovieQueue.created_at.asc())
+)
+_FIND_IDS_BY_STATUS_UPDATED = (
+    select(MovieQueue.id).where(MovieQueue.status == bindparam("status")).order_by(MovieQueue.updated_at.asc())
+)
+
 
 class QueueRepository:
     def __init__(self, session: Session):
         self._session = session
 
     def find_by_status(
-        self, status: QueueStatus, *, order_by_updated: bool = False, limit: int | None = None,
+        self,
+        status: QueueStatus,
+        *,
+        limit: int | None = None,
+        with_movie: bool = False,
     ) -> list[MovieQueue]:
-        q = select(MovieQueue).where(MovieQueue.status == status)
-        if order_by_updated:
-            q = q.order_by(MovieQueue.updated_at.asc())
-        else:
-            q = q.order_by(MovieQueue.created_at.asc())
+        q = _FIND_BY_STATUS
         if limit:
             q = q.limit(limit)
-        return self._session.execute(q).scalars().all()
+        if with_movie:
+            # One extra "WHERE tmdb_id IN (...)" query instead of a lazy load per queue entry.
+            q = q.options(selectinload(MovieQueue.movie))
+        return self._session.execute(q, {"status": status}).scalars().all()
 
-    def find_movies_without_queue(self) -> list[Movie]:
+    def find_ids_by_status_updated(self, status: QueueStatus, *, limit: int | None = None) -> list[int]:
+        q = _FIND_IDS_BY_STATUS_UPDATED
+        if limit:
+            q = q.limit(limit)
+        return self._session.execute(q, {"status": status}).scalars().all()
+
+    def find_by_ids_with_movie(self, ids: list[int]) -> list[MovieQueue]:
         return self._session.execute(
-            select(Movie)
+            select(MovieQueue).where(MovieQueue.id.in_(ids)).options(selectinload(MovieQueue.movie))
+        ).scalars().all()
+
+    def insert_missing(self) -> int:
+        missing = (
+            select(Movie.tmdb_id)
             .outerjoin(MovieQueue, Movie.tmdb_id == MovieQueue.tmdb_id)
             .where(MovieQueue.tmdb_id.is_(None))
-        ).scalars().all()
+        )
+        result = self._session.execute(insert(MovieQueue).from_select(["tmdb_id"], missing))
+        return result.rowcount
 
     def add(self, entity: MovieQueue) -> None:
         self._session.add(entity)
@@ -40,27 +64,51 @@ class QueueRepository:
         message: str | None = None,
         movie_ids: list[int] | None = None,
     ) -> int:
-        q = update(MovieQueue)
-        if movie_ids:
-            q = q.where(MovieQueue.tmdb_id.in_(movie_ids))
-        q = q.values(status=target_status, message=message, retries=0, updated_at=datetime.now(timezone.utc))
-        result = self._session.execute(q)
-        return result.rowcount
+        q = update(MovieQueue).values(
+            status=target_status, message=message, retries=0
+        )
+        if not movie_ids:
+            return self._session.execute(q).rowcount
+        count = 0
+        for i in range(0, len(movie_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = movie_ids[i : i + IN_CLAUSE_CHUNK_SIZE]
+            count += self._session.execute(q.where(MovieQueue.tmdb_id.in_(chunk))).rowcount
+        return count
 
     def list_with_titles(
         self, *, page: int = 1, per_page: int = 20, status: QueueStatus | None = None,
-    ) -> tuple[list[Row[tuple[MovieQueue, str | None]]], int]:
-        q = select(MovieQueue, Movie.title).outerjoin(Movie, MovieQueue.tmdb_id == Movie.tmdb_id)
+    ) -> tuple[list[Row], int]:
+        # Column-only rows: listing never needs the ORM entity or its preprocessed_description text.
         count_q = select(func.count(MovieQueue.id))
         if status:
-            q = q.where(MovieQueue.status == status)
             count_q = count_q.where(MovieQueue.status == status)
-        total = self._session.execute(count_q).scalar() or 0
+        # An uncorrelated scalar subquery is evaluated once and, unlike count() OVER (),
+        # leaves SQLite free to walk ix_movie_queues_status_updated_at_id instead of sorting.
+        q = select(
+            MovieQueue.id,
+            MovieQueue.tmdb_id,
+            Movie.title,
+            MovieQueue.status,
+            MovieQueue.retries,
+            MovieQueue.message,
+            MovieQueue.created_at,
+            MovieQueue.updated_at,
+            count_q.scalar_subquery().label("total"),
+        ).outerjoin(Movie, MovieQueue.tmdb_id == Movie.tmdb_id)
+        if status:
+            q = q.where(MovieQueue.status == status)
         rows = self._session.execute(
             q.order_by(MovieQueue.updated_at.desc().nullslast(), MovieQueue.id.desc())
             .offset((page - 1) * per_page)
             .limit(per_page)
         ).all()
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there is no row to carry the total.
+            total = self._session.execute(count_q).scalar() or 0
+        else:
+            total = 0
         return rows, total
 
     def count_by_status(self) -> dict[str, int]:
@@ -77,7 +125,6 @@ class QueueRepository:
                 status=QueueStatus.REFRESH_DATA,
                 retries=0,
                 message=None,
-                updated_at=datetime.now(timezone.utc),
             )
         )
         return result.rowcount
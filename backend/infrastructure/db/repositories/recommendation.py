@@ -1,18 +1,28 @@
-from sqlalchemy import delete
+from sqlalchemy import bindparam, delete, insert
 from sqlalchemy.orm import Session
 
 from ..models.user import MovieRecommendation
 
+# The session's "evaluate" sync can't resolve bindparam() values, so opt out explicitly;
+# recommendations are never loaded as ORM objects on the request that deletes them.
+_DELETE_FOR_USER = (
+    delete(MovieRecommendation)
+    .where(MovieRecommendation.user_id == bindparam("user_id"))
+    .execution_options(synchronize_session=False)
+)
+
 
 class RecommendationRepository:
     def __init__(self, session: Session):
         self._session = session
 
-    def add_all(self, recommendations: list[MovieRecommendation]) -> None:
-        self._session.add_all(recommendations)
+    def add_for_user(self, user_id: int, tmdb_ids: list[int]) -> None:
+        if not tmdb_ids:
+            return
+        self._session.execute(
+            insert(MovieRecommendation),
+            [{"user_id": user_id, "tmdb_id": tmdb_id} for tmdb_id in tmdb_ids],
+        )
 
     def delete_for_user(self, user_id: int) -> int:
-        result = self._session.execute(
-            delete(MovieRecommendation).where(MovieRecommendation.user_id == user_id)
-        )
-        return result.rowcount
+        return self._session.execute(_DELETE_FOR_USER, {"user_id": user_id}).rowcount
@@ -0,0 +1,21 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..models.movie import Movie
+from ..models.user import User
+
+
+class StatsRepository:
+    def __init__(self, session: Session):
+        self._session = session
+
+    def totals(self) -> tuple[int, int, int]:
+        """Return (total_movies, total_users, active_users) in a single round trip."""
+        users = select(
+            func.count(User.id).label("total"),
+            func.count(User.id).filter(User.disabled.is_(False)).label("active"),
+        ).subquery()
+        row = self._session.execute(
+            select(select(func.count(Movie.id)).scalar_subquery(), users.c.total, users.c.active)
+        ).one()
+        return row[0] or 0, row[1] or 0, row[2] or 0
@@ -1,21 +1,36 @@
-from sqlalchemy import func, select
+from sqlalchemy import Row, bindparam, func, select, update
 from sqlalchemy.orm import Session
 
 from ..models.user import User
 
+_FIND_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_FIND_AUTH_FIELDS_BY_EMAIL = select(User.id, User.email, User.disabled, User.scopes).where(
+    User.email == bindparam("email")
+)
+_FIND_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
 
 class UserRepository:
     def __init__(self, session: Session):
         self._session = session
 
     def find_by_email(self, email: str) -> User | None:
+        return self._session.execute(_FIND_BY_EMAIL, {"email": email}).scalar()
+
+    def find_auth_fields_by_email(self, email: str) -> Row[tuple[int, str, bool, str]] | None:
+        return self._session.execute(_FIND_AUTH_FIELDS_BY_EMAIL, {"email": email}).first()
+
+    def find_by_id(self, user_id: int) -> User | None:
+        return self._session.execute(_FIND_BY_ID, {"user_id": user_id}).scalar()
+
+    def update_scopes(self, user_id: int, scopes: str) -> str | None:
         return self._session.execute(
-            select(User).where(User.email == email)
+            update(User).where(User.id == user_id).values(scopes=scopes).returning(User.email)
         ).scalar()
 
-    def find_by_id(self, user_id: int) -> User | None:
+    def update_disabled(self, user_id: int, disabled: bool) -> str | None:
         return self._session.execute(
-            select(User).where(User.id == user_id)
+            update(User).where(User.id == user_id).values(disabled=disabled).returning(User.email)
         ).scalar()
 
     def add(self, user: User) -> User:
@@ -25,23 +40,25 @@ class UserRepository:
         return user
 
     def list_paginated(
-        self, *, page: int = 1, per_page: int = 20, search: str = "",
+        self, *, page: int = 1, per_page: int = 20, search: str = "", prefix: bool = False, after_id: int | None = None,
     ) -> tuple[list[User], int]:
         q = select(User)
         count_q = select(func.count(User.id))
         if search:
-            q = q.where(User.email.icontains(search))
-            count_q = count_q.where(User.email.icontains(search))
+            if prefix:
+                # A range over lower(email) can seek ix_users_email_lower; SQLite's LIKE cannot use expression indexes.
+                needle = search.lower()
+                email_lower = func.lower(User.email)
+                condition = (email_lower >= needle) & (email_lower < needle + chr(0x10FFFF))
+            else:
+                condition = User.email.icontains(search)
+            q = q.where(condition)
+            count_q = count_q.where(condition)
         total = self._session.execute(count_q).scalar() or 0
-        users = self._session.execute(
-            q.order_by(User.id).offset((page - 1) * per_page).limit(per_page)
-        ).scalars().all()
+        if after_id is not None:
+            # Keyset: seek past the cursor on the primary key instead of scanning and discarding OFFSET rows.
+            q = q.where(User.id > after_id)
+        else:
+            q = q.offset((page - 1) * per_page)
+        users = self._session.execute(q.order_by(User.id).limit(per_page)).scalars().all()
         return users, total
-
-    def count(self) -> int:
-        return self._session.execute(select(func.count(User.id))).scalar() or 0
-
-    def count_active(self) -> int:
-        return self._session.execute(
-            select(func.count(User.id)).where(User.disabled == False)
-        ).scalar() or 0
@@ -1,9 +1,35 @@
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
+# WAL lets readers run alongside the single writer; the rest trade durability on power loss
+# (not on app crash) and memory for fewer syscalls on hot pages.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def create_db_engine(database_url: str) -> Engine:
-    return create_engine(database_url, connect_args={"check_same_thread": False})
+    # A scheduler batch commit can hold the single WAL write lock for a while; wait for it
+    # (sqlite3 defaults to 5s) rather than failing concurrent API writes with "database is locked".
+    engine = create_engine(
+        database_url, connect_args={"check_same_thread": False, "timeout": 30}, pool_size=10, max_overflow=20,
+        query_cache_size=1200,
+    )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -1,8 +1,13 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any
 
 import requests
 from pydantic import BaseModel, ConfigDict, model_validator
+from requests.adapters import HTTPAdapter
+
+LISTING_SUFFIXES = ("now_playing", "top_rated", "popular")
 
 
 class TMDBMovieData(BaseModel):
@@ -66,13 +71,20 @@ class TMDBMovieData(BaseModel):
 
 
 class TMDBClient:
-    def __init__(self, api_key: str, base_url: str = "https://api.themoviedb.org/3"):
+    def __init__(self, api_key: str, base_url: str = "https://api.themoviedb.org/3", max_workers: int = 16):
         self._api_key = api_key
         self._base_url = base_url
+        self._max_workers = max_workers
+        # One keep-alive pool shared by all fetch threads instead of a new TLS handshake per request.
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"Bearer {api_key}"
+        # Every request goes to one host; its pool must hold a connection per fetch thread.
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _get(self, url: str, params: dict[str, Any] | None = None) -> requests.Response:
-        headers = {"Authorization": f"Bearer {self._api_key}"}
-        response = requests.get(url, params=params, headers=headers)
+        response = self._session.get(url, params=params)
         response.raise_for_status()
         return response
 
@@ -80,17 +92,18 @@ class TMDBClient:
         data = self._get(f"{self._base_url}/movie/{suffix}").json()
         return data.get("total_pages", 0)
 
-    def fetch_now_playing_ids(self, page: int = 1) -> set[int]:
-        data = self._get(f"{self._base_url}/movie/now_playing", {"page": page}).json()
-        return {movie["id"] for movie in data.get("results", [])}
-
-    def fetch_top_rated_ids(self, page: int = 1) -> set[int]:
-        data = self._get(f"{self._base_url}/movie/top_rated", {"page": page}).json()
-        return {movie["id"] for movie in data.get("results", [])}
-
-    def fetch_popular_ids(self, page: int = 1) -> set[int]:
-        data = self._get(f"{self._base_url}/movie/popular", {"page": page}).json()
-        return {movie["id"] for movie in data.get("results", [])}
+    def fetch_listing_genre_ids(self, page: int = 1) -> dict[int, list[int] | None]:
+        """Map each now playing, top rated and popular movie on `page` to its `genre_ids`, requested in parallel."""
+        with ThreadPoolExecutor(max_workers=len(LISTING_SUFFIXES)) as executor:
+            futures = [
+                executor.submit(self._get, f"{self._base_url}/movie/{suffix}", {"page": page})
+                for suffix in LISTING_SUFFIXES
+            ]
+            return {
+                movie["id"]: movie.get("genre_ids")
+                for future in futures
+                for movie in future.result().json().get("results", [])
+            }
 
     def fetch_movie_details(self, tmdb_id: int) -> TMDBMovieData:
         data = self._get(
@@ -98,3 +111,17 @@ class TMDBClient:
             {"append_to_response": "keywords,credits"},
         ).json()
         return TMDBMovieData(**data)
+
+    def _try_fetch_movie_details(self, tmdb_id: int) -> tuple[int, TMDBMovieData | Exception]:
+        try:
+            return tmdb_id, self.fetch_movie_details(tmdb_id)
+        except Exception as e:
+            return tmdb_id, e
+
+    def fetch_many_details(self, tmdb_ids: Iterable[int]) -> Iterator[tuple[int, TMDBMovieData | Exception]]:
+        """Fetch details concurrently; failures are yielded as exceptions so one bad ID doesn't abort the batch."""
+        tmdb_ids = list(tmdb_ids)
+        if not tmdb_ids:
+            return
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(tmdb_ids))) as executor:
+            yield from executor.map(self._try_fetch_movie_details, tmdb_ids)
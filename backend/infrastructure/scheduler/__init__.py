@@ -11,7 +11,10 @@ from backend.infrastructure.external.tmdb_client import TMDBClient
 from backend.infrastructure.vector.chroma_store import ChromaVectorStore
 
 logger = get_logger(__name__)
-background_scheduler = BackgroundScheduler()
+# A job never overlaps its own previous run, and ticks missed meanwhile collapse into one catch-up run.
+background_scheduler = BackgroundScheduler(
+    job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60},
+)
 
 
 def start_scheduler() -> None:
@@ -6,14 +6,18 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from backend.core.logging import get_logger
 from backend.core.settings import Settings
-from backend.domain.policies import is_acceptable_movie
-from backend.infrastructure.db.models import Movie, MovieQueue, QueueStatus
+from backend.domain.policies import is_acceptable_movie, is_acceptable_prefilter
+from backend.infrastructure.db.models import QueueStatus
 from backend.infrastructure.db.repositories.movie import MovieRepository
 from backend.infrastructure.external.tmdb_client import TMDBClient
 from backend.infrastructure.vector.chroma_store import ChromaVectorStore
 
 logger = get_logger(__name__)
 
+# Refresh work is loaded, fetched and committed this many queue entries at a time, so memory stays
+# bounded and a failure only loses the current chunk.
+REFRESH_CHUNK_SIZE = 200
+
 
 def job_fetch_current_movies(
     session_factory: sessionmaker[Session],
@@ -26,39 +30,44 @@ def job_fetch_current_movies(
     try:
         session = session_factory()
         movie_repo = MovieRepository(session)
+        # IDs already fetched this run. Rejected or failed movies never reach the DB, so without this
+        # the same ID showing up again on a later page (or another listing) would be fetched again.
+        seen_tmdb_ids: set[int] = set()
 
         for page in range(1, pages + 1):
             logger.info(f"Processing page {page}...")
             try:
-                now_playing = tmdb_client.fetch_now_playing_ids(page)
-                top_rated = tmdb_client.fetch_top_rated_ids(page)
-                popular = tmdb_client.fetch_popular_ids(page)
-                fetched_tmdb_ids = now_playing | top_rated | popular
+                listing = tmdb_client.fetch_listing_genre_ids(page)
 
-                tmdb_ids_in_db = movie_repo.find_tmdb_ids_in_db(fetched_tmdb_ids)
-                tmdb_ids_not_in_db = fetched_tmdb_ids - set(tmdb_ids_in_db)
+                tmdb_ids_in_db = set(movie_repo.find_tmdb_ids_in_db(set(listing)))
+                tmdb_ids_not_in_db = listing.keys() - tmdb_ids_in_db - seen_tmdb_ids
 
                 if not tmdb_ids_not_in_db:
                     logger.info(f"No new movies to add from page {page}.")
                     continue
 
-                new_movies_to_add: list[Movie | MovieQueue] = []
-                for tmdb_id in tmdb_ids_not_in_db:
+                # Skip the detail request for movies the listing's genre_ids already rule out.
+                tmdb_ids_to_fetch = [i for i in tmdb_ids_not_in_db if is_acceptable_prefilter(listing[i])]
+                seen_tmdb_ids.update(tmdb_ids_not_in_db)
+
+                new_movie_rows: list[dict[str, Any]] = []
+                # Details are fetched concurrently; session work stays here, on the session's thread.
+                for tmdb_id, validated_movie in tmdb_client.fetch_many_details(tmdb_ids_to_fetch):
                     try:
-                        validated_movie = tmdb_client.fetch_movie_details(tmdb_id)
+                        if isinstance(validated_movie, Exception):
+                            raise validated_movie
                         if is_acceptable_movie(validated_movie.genres, validated_movie.spoken_languages):
-                            new_movies_to_add.append(Movie(**validated_movie.model_dump()))
-                            new_movies_to_add.append(MovieQueue(tmdb_id=validated_movie.tmdb_id))
+                            new_movie_rows.append(validated_movie.model_dump())
                     except Exception as e:
                         logger.error(f"Failed to process movie ID '{tmdb_id}': {e}", exc_info=True)
 
-                if not new_movies_to_add:
+                if not new_movie_rows:
                     logger.info(f"Found {len(tmdb_ids_not_in_db)} new IDs, but none were my kind of movie.")
                     continue
 
-                movie_repo.add_all(new_movies_to_add)
+                added_count = movie_repo.add_many_with_queue(new_movie_rows)
                 session.commit()
-                logger.warning(f"Added '{len(new_movies_to_add) // 2}' new movies from page {page}")
+                logger.warning(f"Added '{added_count}' new movies from page {page}")
 
             except Exception as e:
                 logger.error(f"Unexpected error while fetching movies on page {page}: '{e}'", exc_info=True)
@@ -83,38 +92,46 @@ def process_queue_refresh_database(
         session = session_factory()
         from backend.infrastructure.db.repositories.queue import QueueRepository
         queue_repo = QueueRepository(session)
-        movie_queues = queue_repo.find_by_status(
-            QueueStatus.REFRESH_DATA, order_by_updated=True, limit=actual_limit
-        )
+        movie_repo = MovieRepository(session)
+        queue_ids = queue_repo.find_ids_by_status_updated(QueueStatus.REFRESH_DATA, limit=actual_limit)
 
-        if not movie_queues:
+        if not queue_ids:
             logger.info("No movie in need of refresh. Returning...")
             return
 
-        logger.info(f"Found {len(movie_queues)} movie(s) to refresh.")
+        logger.info(f"Found {len(queue_ids)} movie(s) to refresh.")
         fail_count = 0
-        changed_movies_count = 0
+        changed_count = 0
+
+        for i in range(0, len(queue_ids), REFRESH_CHUNK_SIZE):
+            movie_queues = queue_repo.find_by_ids_with_movie(queue_ids[i : i + REFRESH_CHUNK_SIZE])
+            changed_rows: list[dict[str, Any]] = []
+
+            results = tmdb_client.fetch_many_details([queue.tmdb_id for queue in movie_queues])
+            for queue, (_, validated_movie) in zip(movie_queues, results):
+                try:
+                    if isinstance(validated_movie, Exception):
+                        raise validated_movie
+                    changes = queue.movie.diff(validated_movie)
+                    queue.status = QueueStatus.PREPROCESS_DESCRIPTION if changes else QueueStatus.COMPLETED
+                    if changes:
+                        changed_rows.append({"id": queue.movie.id, **changes})
+                    if queue.retries > 0:
+                        queue.retries = 0
+                        queue.message = None
+                except Exception as e:
+                    logger.error(f"Failed to refresh movie TMDB ID '{queue.tmdb_id}': {e}", exc_info=True)
+                    queue.retries += 1
+                    fail_count += 1
+                    queue.message = str(e)
+                    if queue.retries > settings.scheduler.max_retries:
+                        queue.status = QueueStatus.FAILED
+
+            movie_repo.bulk_update(changed_rows)
+            session.commit()
+            changed_count += len(changed_rows)
 
-        for queue in movie_queues:
-            try:
-                validated_movie = tmdb_client.fetch_movie_details(queue.tmdb_id)
-                changed = queue.movie.update(validated_movie)
-                queue.status = QueueStatus.PREPROCESS_DESCRIPTION if changed else QueueStatus.COMPLETED
-                if changed:
-                    changed_movies_count += 1
-                if queue.retries > 0:
-                    queue.retries = 0
-                    queue.message = None
-            except Exception as e:
-                logger.error(f"Failed to refresh movie TMDB ID '{queue.tmdb_id}': {e}", exc_info=True)
-                queue.retries += 1
-                fail_count = 1
-                queue.message = str(e)
-                if queue.retries > settings.scheduler.max_retries:
-                    queue.status = QueueStatus.FAILED
-
-        logger.warning(f"Refreshed '{len(movie_queues)}' movie(s): '{fail_count}' failed, '{changed_movies_count}' with changes.")
-        session.commit()
+        logger.warning(f"Refreshed '{len(queue_ids)}' movie(s): '{fail_count}' failed, '{changed_count}' with changes.")
     except Exception as e:
         logger.error(f"A critical error occurred during the queue processing job: {e}", exc_info=True)
         if session:
@@ -131,7 +148,7 @@ def process_queue_descriptions(session_factory: sessionmaker[Session]) -> None:
         session = session_factory()
         from backend.infrastructure.db.repositories.queue import QueueRepository
         queue_repo = QueueRepository(session)
-        movie_queues = queue_repo.find_by_status(QueueStatus.PREPROCESS_DESCRIPTION)
+        movie_queues = queue_repo.find_by_status(QueueStatus.PREPROCESS_DESCRIPTION, with_movie=True)
 
         if not movie_queues:
             logger.info("No movie in need of refresh. Returning...")
@@ -160,7 +177,7 @@ def process_queue_add_to_vector_store(
         session = session_factory()
         from backend.infrastructure.db.repositories.queue import QueueRepository
         queue_repo = QueueRepository(session)
-        movie_queues = queue_repo.find_by_status(QueueStatus.CREATE_EMBEDDING)
+        movie_queues = queue_repo.find_by_status(QueueStatus.CREATE_EMBEDDING, with_movie=True)
 
         if not movie_queues:
             logger.info("No movie in need of new embeddings. Returning...")
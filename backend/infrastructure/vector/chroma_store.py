@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import chromadb
@@ -8,6 +9,8 @@ from backend.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
 
 class ChromaVectorStore:
     def __init__(self, path: str, model_name: str, use_cuda: bool = False):
@@ -15,20 +18,25 @@ class ChromaVectorStore:
         self._model_name = model_name
         self._use_cuda = use_cuda
         self._collection: Collection | None = None
+        self._embedding_function: embedding_functions.SentenceTransformerEmbeddingFunction | None = None
+        # Embedding the query text dominates query latency and is deterministic, unlike the results
+        # (exclusions and the collection change between calls), so cache the embedding, not the hits.
+        self._embed_query = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._compute_query_embedding)
 
     def initialize(self) -> None:
         try:
             logger.info("Loading ChromaDB collection...")
             client = chromadb.PersistentClient(path=self._path)
+            self._embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+                model_name=self._model_name,
+                normalize_embeddings=True,
+                trust_remote_code=True,
+                device="cuda" if self._use_cuda else "cpu",
+            )
             self._collection = client.get_or_create_collection(
                 "documents",
                 metadata={"hnsw:space": "cosine"},
-                embedding_function=embedding_functions.SentenceTransformerEmbeddingFunction(
-                    model_name=self._model_name,
-                    normalize_embeddings=True,
-                    trust_remote_code=True,
-                    device="cuda" if self._use_cuda else "cpu",
-                ),
+                embedding_function=self._embedding_function,
             )
         except Exception as e:
             logger.error(f"Failed to initialize ChromaDB collection: {e}", exc_info=True)
@@ -38,6 +46,9 @@ class ChromaVectorStore:
         if self._collection is None:
             self.initialize()
 
+    def _compute_query_embedding(self, query_text: str) -> Any:
+        return self._embedding_function([f"search_query: {query_text}"])[0]
+
     def store(
         self,
         ids: list[str],
@@ -54,7 +65,8 @@ class ChromaVectorStore:
             batch_ids = ids[i : i + max_batch_size]
             batch_documents = prefixed_documents[i : i + max_batch_size]
             batch_metadatas = metadatas[i : i + max_batch_size]
-            self._collection.add(ids=batch_ids, documents=batch_documents, metadatas=batch_metadatas)
+            # Upsert so a movie re-queued after a TMDB refresh replaces its old vector instead of erroring.
+            self._collection.upsert(ids=batch_ids, documents=batch_documents, metadatas=batch_metadatas)
         logger.warning("Processing completed")
 
     def query(
@@ -68,7 +80,7 @@ class ChromaVectorStore:
         self._ensure_loaded()
         logger.debug(f"Query: '{query_text}' | where={where_filter} | doc_filter={where_document_filter}")
         results = self._collection.query(
-            query_texts=[f"search_query: {query_text}"],
+            query_embeddings=[self._embed_query(query_text)],
             n_results=k,
             include=["metadatas", "distances"],
             where=where_filter,
@@ -1,21 +1,21 @@
 import gzip
+import io
 import json
-import shutil
 import threading
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from time import sleep
+from typing import Any
 
 import pandas as pd
 import regex
 import requests
-from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
 from ..core.logging import get_logger
 from ..core.settings import get_settings
 from ..infrastructure.db.base import Base
-from ..infrastructure.db.models import Movie, MovieQueue
+from ..infrastructure.db.repositories.movie import MovieRepository
 from ..infrastructure.db.session import create_db_engine, create_session_factory
 from ..infrastructure.external.tmdb_client import TMDBClient
 from ..infrastructure.scheduler.jobs import process_queue_descriptions, process_queue_add_to_vector_store
@@ -26,6 +26,24 @@ logger = get_logger(__name__)
 LATIN_CHARS = regex.compile(r"[\p{Latin}0-9\s.,!?;:/\'\"()\-\[\]–—\u201c\u201d\u2018\u2019@]")
 
 
+class _LatinDeleteTable(dict):
+    """`str.translate` table that deletes LATIN_CHARS; each code point is classified by the regex once."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = self[codepoint] = None if LATIN_CHARS.fullmatch(chr(codepoint)) else codepoint
+        return value
+
+
+_LATIN_DELETE_TABLE = _LatinDeleteTable()
+
+# Rows parsed per pandas chunk while streaming the export; bounds peak memory before filtering.
+EXPORT_READ_CHUNK_SIZE = 50_000
+
+# Rows whose details are fetched concurrently before being written in order; small enough that an
+# interrupted run redoes little work.
+FETCH_WINDOW_SIZE = 64
+
+
 def get_populate_db_paths() -> dict[str, Path]:
     settings = get_settings()
     populate_db_path = settings.database.populate_db_path
@@ -36,25 +54,39 @@ def get_populate_db_paths() -> dict[str, Path]:
     }
 
 
-def download_and_extract_export_file(url: str) -> None:
-    paths = get_populate_db_paths()
+def filter_mostly_latin(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    # Resolved once here rather than through get_settings() for every title.
+    threshold = get_settings().populate_db.latin_threshold
+    total = 0
+    kept: list[pd.DataFrame] = []
+    for chunk in chunks:
+        total += len(chunk)
+        kept.append(chunk[chunk["original_title"].apply(is_mostly_latin, threshold=threshold)])
+    # A fresh 0..n-1 index keeps row labels equal to the positions the resume state refers to.
+    movies = pd.concat(kept, ignore_index=True)
+    print("Movie count:", total)
+    print("Movie count after filtering:", len(movies))
+    return movies
+
+
+def download_and_filter_export_file(url: str) -> pd.DataFrame:
+    """Decompress and parse the export while it downloads, without writing the extracted JSON to disk."""
     with requests.get(url, stream=True) as r:
         r.raise_for_status()
-        with gzip.GzipFile(fileobj=r.raw) as f_in:
-            with open(paths["daily_ids_export"], "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-    print(f"Extracted: {paths['daily_ids_export']}")
+        with gzip.GzipFile(fileobj=r.raw) as gz, io.TextIOWrapper(gz, encoding="utf-8") as lines:
+            return filter_mostly_latin(pd.read_json(lines, lines=True, chunksize=EXPORT_READ_CHUNK_SIZE))
 
 
-def is_mostly_latin(text: str, threshold: float = 0.9) -> bool:
-    settings = get_settings()
-    actual_threshold = threshold if threshold != 0.9 else settings.populate_db.latin_threshold
+def is_mostly_latin(text: str, threshold: float | None = None) -> bool:
+    if threshold is None:
+        threshold = get_settings().populate_db.latin_threshold
     text = text.strip()
     text_len = len(text)
     if text_len == 0:
         return False
-    latin_count = len(LATIN_CHARS.findall(text))
-    return (latin_count / text_len) >= actual_threshold
+    # translate() walks the string in C with cached lookups, instead of building a findall() match list.
+    latin_count = text_len - len(text.translate(_LATIN_DELETE_TABLE))
+    return (latin_count / text_len) >= threshold
 
 
 def save_state(idx: int) -> None:
@@ -77,7 +109,9 @@ def _create_session_and_deps() -> tuple[sessionmaker, TMDBClient, ChromaVectorSt
     engine = create_db_engine(settings.database.database_url)
     session_factory = create_session_factory(engine)
     Base.metadata.create_all(bind=engine)
-    tmdb_client = TMDBClient(settings.tmdb.tmdb_api_key, settings.tmdb.tmdb_base_url)
+    tmdb_client = TMDBClient(
+        settings.tmdb.tmdb_api_key, settings.tmdb.tmdb_base_url, settings.tmdb.tmdb_concurrency,
+    )
     vector_store = ChromaVectorStore(
         str(settings.embedding.vector_store_path),
         settings.embedding.embedding_model,
@@ -88,13 +122,34 @@ def _create_session_and_deps() -> tuple[sessionmaker, TMDBClient, ChromaVectorSt
 
 def finish_processing_in_background(
     stop_processing: threading.Event,
+    work_available: threading.Event,
     session_factory: sessionmaker,
     vector_store: ChromaVectorStore,
 ) -> None:
     while not stop_processing.is_set():
         process_queue_descriptions(session_factory)
         process_queue_add_to_vector_store(session_factory, vector_store)
-        sleep(10)
+        # Set after every producer commit and on shutdown; the timeout only guards against a missed signal.
+        work_available.wait(timeout=60)
+        work_available.clear()
+
+
+def _iter_fetch_windows(
+    movies: pd.DataFrame, start_idx: int, movie_repo: MovieRepository,
+) -> Iterator[list[tuple[int, int]]]:
+    # Plain Python ints from the id column; iterrows() would build a Series per row.
+    ids = movies["id"].to_numpy()[start_idx:].tolist()
+    for offset in range(0, len(ids), FETCH_WINDOW_SIZE):
+        window_ids = ids[offset : offset + FETCH_WINDOW_SIZE]
+        # One indexed IN lookup per window instead of loading every tmdb_id in the table up front.
+        in_db = set(movie_repo.find_tmdb_ids_in_db(set(window_ids)))
+        window = [
+            (idx, row_id)
+            for idx, row_id in enumerate(window_ids, start=start_idx + offset)
+            if row_id not in in_db
+        ]
+        if window:
+            yield window
 
 
 def process_movies(
@@ -109,42 +164,55 @@ def process_movies(
     logger.info(f"Resuming from index '{start_idx}'")
     db = session_factory()
     stop_processing = threading.Event()
-    threading.Thread(target=finish_processing_in_background, args=(stop_processing, session_factory, vector_store), daemon=True).start()
+    work_available = threading.Event()
+    threading.Thread(
+        target=finish_processing_in_background,
+        args=(stop_processing, work_available, session_factory, vector_store),
+        daemon=True,
+    ).start()
     try:
-        current_ids = set(db.execute(select(Movie.tmdb_id)).scalars().all())
-        added_counter = 0
-        for idx, row in movies.iloc[start_idx:].iterrows():
-            row_id = row.get("id")
-            if row_id is None:
-                continue
-            try:
-                if row_id in current_ids:
-                    continue
-                validated_movie = tmdb_client.fetch_movie_details(row_id)
-                if not is_acceptable_movie(validated_movie.genres, validated_movie.spoken_languages):
-                    continue
-                movie = Movie(**validated_movie.model_dump())
-                queue_entry = MovieQueue(tmdb_id=validated_movie.tmdb_id)
-                db.add_all([movie, queue_entry])
-                added_counter += 1
-                if added_counter % settings.populate_db.commit_interval == 0:
-                    db.commit()
-                    save_state(idx + 1)
-            except KeyboardInterrupt:
-                db.commit()
-                save_state(idx)
-                logger.info("Interrupted by user. Run again to resume from saved state.")
-                exit(1)
-            except requests.RequestException as e:
-                logger.error(f"Network error at row '{idx}', id={row_id}: {e}")
-            except SQLAlchemyError as e:
-                logger.critical(f"Database error: '{e}'")
-                db.rollback()
-                exit(1)
-            except Exception as e:
-                logger.critical(f"Unexpected error at row '{idx}', id={row_id}: {e}")
+        movie_repo = MovieRepository(db)
+        # Accepted movies are buffered as plain rows and written with one executemany per commit.
+        pending_rows: list[dict[str, Any]] = []
+        # First row not yet handled; results are consumed in row order, so everything before it is done.
+        next_idx = start_idx
+        try:
+            for window in _iter_fetch_windows(movies, start_idx, movie_repo):
+                details = tmdb_client.fetch_many_details([row_id for _, row_id in window])
+                for (idx, row_id), (_, validated_movie) in zip(window, details):
+                    next_idx = idx + 1
+                    try:
+                        if isinstance(validated_movie, Exception):
+                            raise validated_movie
+                        if not is_acceptable_movie(validated_movie.genres, validated_movie.spoken_languages):
+                            continue
+                        pending_rows.append(validated_movie.model_dump())
+                        if len(pending_rows) >= settings.populate_db.commit_interval:
+                            movie_repo.add_many_with_queue(pending_rows)
+                            db.commit()
+                            work_available.set()
+                            pending_rows.clear()
+                            save_state(next_idx)
+                    except requests.RequestException as e:
+                        logger.error(f"Network error at row '{idx}', id={row_id}: {e}")
+                    except SQLAlchemyError as e:
+                        logger.critical(f"Database error: '{e}'")
+                        db.rollback()
+                        exit(1)
+                    except Exception as e:
+                        logger.critical(f"Unexpected error at row '{idx}', id={row_id}: {e}")
+            # The last partial commit_interval would otherwise be dropped by db.close().
+            movie_repo.add_many_with_queue(pending_rows)
+            db.commit()
+        except KeyboardInterrupt:
+            movie_repo.add_many_with_queue(pending_rows)
+            db.commit()
+            save_state(next_idx)
+            logger.info("Interrupted by user. Run again to resume from saved state.")
+            exit(1)
     finally:
         stop_processing.set()
+        work_available.set()
         db.close()
     save_state(len(movies))
     logger.info("Processed all available rows")
@@ -158,18 +226,18 @@ def populate_db(url: str | None, resume: bool) -> None:
             paths["state_file"].unlink()
         if paths["filtered_daily_ids_export"].exists():
             paths["filtered_daily_ids_export"].unlink()
-        download_and_extract_export_file(url)
-    else:
+        movies = download_and_filter_export_file(url)
+        # The filtered CSV is what --resume reads back; its row order defines the saved resume index.
+        movies.to_csv(paths["filtered_daily_ids_export"], index=False)
+    elif paths["filtered_daily_ids_export"].exists():
         logger.info("URL not provided. Resuming...")
-
-    if paths["filtered_daily_ids_export"].exists():
         movies = pd.read_csv(paths["filtered_daily_ids_export"])
     elif paths["daily_ids_export"].exists():
-        movies = pd.read_json(paths["daily_ids_export"], lines=True)
-        mask_is_mostly_latin = movies["original_title"].apply(is_mostly_latin)
-        print("Movie count:", len(movies))
-        movies = movies[mask_is_mostly_latin]
-        print("Movie count after filtering:", len(movies))
+        # Export extracted to disk by an older version of this tool.
+        logger.info("URL not provided. Resuming...")
+        movies = filter_mostly_latin(
+            pd.read_json(paths["daily_ids_export"], lines=True, chunksize=EXPORT_READ_CHUNK_SIZE)
+        )
         movies.to_csv(paths["filtered_daily_ids_export"], index=False)
     else:
         logger.info("File not found. Please provide an URL with --url option and try again.")
@@ -10,6 +10,7 @@ export interface AdminUserList {
   total: number;
   page: number;
   per_page: number;
+  next_cursor: number | null;
 }
 
 export interface QueueItem {
@@ -0,0 +1,38 @@
+"""add movies weighted score index
+
+Revision ID: 9b41d7c2e6f0
+Revises: 5c2f9e1b7a44
+Create Date: 2026-10-16 00:12:08.551932
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b41d7c2e6f0'
+down_revision: Union[str, Sequence[str], None] = '5c2f9e1b7a44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Must match the expression SQLAlchemy renders for WEIGHTED_SCORE, or SQLite won't use the index.
+    op.create_index(
+        'ix_movies_weighted_score',
+        'movies',
+        [
+            sa.text('(vote_average * vote_count) / ((vote_count + 100) + 0.0) DESC'),
+            sa.text('vote_count DESC'),
+            sa.text('popularity DESC'),
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_weighted_score', table_name='movies')
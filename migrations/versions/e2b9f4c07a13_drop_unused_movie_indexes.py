@@ -0,0 +1,43 @@
+"""drop unused movie indexes
+
+Revision ID: e2b9f4c07a13
+Revises: c4e7a2d91f38
+Create Date: 2026-10-16 00:48:03.915472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9f4c07a13'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a2d91f38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Only ever filtered with LIKE '%...%' (which can't seek a B-tree) or with low-selectivity ranges that
+# the ix_movies_weighted_score walk already serves; each one only slowed down inserts.
+DROPPED_COLUMNS = (
+    'title',
+    'runtime',
+    'vote_average',
+    'vote_count',
+    'popularity',
+    'genres',
+    'spoken_languages',
+    'production_countries',
+    'keywords',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in DROPPED_COLUMNS:
+        op.drop_index(op.f(f'ix_movies_{column}'), table_name='movies', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in DROPPED_COLUMNS:
+        op.create_index(op.f(f'ix_movies_{column}'), 'movies', [column], unique=False, if_not_exists=True)
@@ -27,7 +27,7 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_
 
 with open(Path(__file__).parent / "external_api_example_response.json", encoding="utf-8") as f:
     MOVIE_RESPONSE: dict = json.load(f)
-GENERIC_RESPONSE = {"results": [{"id": 550}, {"id": 551}, {"id": 552}]}
+GENERIC_RESPONSE = {"results": [{"id": 550, "genre_ids": [18, 53]}, {"id": 551, "genre_ids": [99]}, {"id": 552}]}
 
 
 class MockResponseObject:
@@ -102,7 +102,10 @@ def in_memory_test_db():
 
 @pytest.fixture(scope="function")
 def mock_external_api_requests(monkeypatch):
-    monkeypatch.setattr("backend.infrastructure.external.tmdb_client.requests.get", mock_requests_get)
+    monkeypatch.setattr(
+        "backend.infrastructure.external.tmdb_client.requests.Session.get",
+        lambda self, url, **kwargs: mock_requests_get(url, **kwargs),
+    )
 
 
 @pytest.fixture(scope="function")
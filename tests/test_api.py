@@ -1,12 +1,23 @@
+import os
+import sqlite3
+
 from fastapi.testclient import TestClient
 
+from backend.api.routers.admin import _list_backups
 from backend.api.schemas.movie import MovieFilter, MovieSearch
 from backend.api.schemas.auth import UserCreate
+from backend.infrastructure.db.repositories.queue import IN_CLAUSE_CHUNK_SIZE
+from tests.conftest import test_engine
 
 
 def test_root_endpoint(client: TestClient):
     response = client.get("/")
     assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+    response = client.get("/img/logo.svg")
+    assert response.status_code == 200
+    assert "max-age" in response.headers["cache-control"]
 
 
 def test_v1_endpoints(client: TestClient):
@@ -19,14 +30,36 @@ def test_v1_endpoints(client: TestClient):
     assert len(movies) > 0
     assert all("title" in movie for movie in movies)
 
+    # Explicit nulls for the thresholds fall back to the defaults rather than failing validation.
+    response = client.post(
+        "/v1/movie",
+        json={"genres": ["Drama"], "runtime_min": None, "vote_average_min": None, "vote_count_min": None},
+    )
+    assert response.status_code == 200
+
     response = client.post("/v1/movie", json={"genres": ["NonExistentGenre"]})
     assert response.status_code == 404
 
+    response = client.post("/v1/movie", json={})
+    assert response.status_code == 422
+
+    response = client.post("/v2/search", json={"n_results": 3})
+    assert response.status_code == 422
+
 
 def test_v2_endpoints(client: TestClient):
     movie_filter = MovieFilter(genres=["Drama", "Thriller"])
     response = client.post("/v2/movie", json=movie_filter.model_dump())
     assert response.status_code == 200
+    first_tmdb_id = response.json()[0]["tmdb_id"]
+
+    response = client.post("/v2/movie", json=movie_filter.model_dump())
+    assert response.status_code == 404 or response.json()[0]["tmdb_id"] != first_tmdb_id
+
+    response = client.post("/v2/user/forget-recommends")
+    assert response.status_code == 200
+    response = client.post("/v2/user/forget-recommends")
+    assert response.status_code == 404
 
     search = MovieSearch(title="Fight Club", n_results=1)
     response = client.post("/v2/search", json=search.model_dump())
@@ -77,6 +110,10 @@ def test_auth_endpoints(client: TestClient):
     assert "access_token" in api_key_data
     assert api_key_data["token_type"] == "bearer"
 
+    form_data = {"username": user_dict["email"], "password": user_dict["password"], "scope": "movie:read movie:write"}
+    response = client.post("/auth/login", data=form_data)
+    assert response.status_code == 401
+
     wrong_form_data = {"username": user_dict["email"], "password": "wrongpassword", "scopes": "movie:read"}
     response = client.post("/auth/login", data=wrong_form_data)
     assert response.status_code == 401
@@ -86,3 +123,125 @@ def test_auth_endpoints(client: TestClient):
 
     response = client.get("/auth/write-test", headers={"Authorization": "Bearer key"})
     assert response.status_code == 200
+
+
+def test_admin_sync(client: TestClient):
+    response = client.get("/admin/sync")
+    assert response.status_code == 200
+    assert response.json()["detail"] == "Recreated '2' missing MovieQueue entries."
+
+    response = client.get("/admin/sync")
+    assert response.status_code == 404
+
+
+def test_admin_update_user(client: TestClient):
+    user = UserCreate(email="admin-target@example.com", password="pass")
+    response = client.post("/auth/signup", json=user.model_dump())
+    assert response.status_code == 200
+
+    response = client.patch("/admin/users/1/scopes", json={"scopes": ["movie:read", "movie:write"]})
+    assert response.status_code == 200
+    assert response.json()["scopes"] == "movie:read movie:write"
+
+    response = client.patch("/admin/users/99/scopes", json={"scopes": ["movie:read"]})
+    assert response.status_code == 404
+
+    response = client.patch("/admin/users/1/scopes", json={"scopes": ["movie:read", "movie:delete"]})
+    assert response.status_code == 400
+
+    response = client.patch("/admin/users/1/status", json={"disabled": True})
+    assert response.status_code == 400
+
+    response = client.patch("/admin/users/99/status", json={"disabled": True})
+    assert response.status_code == 404
+
+
+def test_admin_list_users_search(client: TestClient):
+    user = UserCreate(email="Search-Target@example.com", password="pass")
+    client.post("/auth/signup", json=user.model_dump())
+
+    response = client.get("/admin/users", params={"search": "target@"})
+    assert response.json()["total"] == 1
+
+    response = client.get("/admin/users", params={"search": "search-t", "prefix": True})
+    assert response.json()["total"] == 1
+
+    response = client.get("/admin/users", params={"search": "target@", "prefix": True})
+    assert response.json()["total"] == 0
+
+
+def test_admin_stats(client: TestClient):
+    client.get("/admin/sync")
+    response = client.get("/admin/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_movies"] == 2
+    assert stats["total_users"] == 0
+    assert stats["disabled_users"] == 0
+    assert stats["total_queue"] == 2
+    assert stats["queue_by_status"] == {"preprocess_description": 2}
+
+
+def test_list_backups(tmp_path):
+    backup_path = tmp_path / "backups"
+    assert _list_backups(backup_path) == ()
+
+    backup_path.mkdir()
+    (backup_path / "a.db").write_bytes(b"x" * 3)
+    (backup_path / "notes.txt").write_text("ignored")
+    assert [(name, size) for name, size, _ in _list_backups(backup_path)] == [("a.db", 3)]
+
+    # A removal by another process shows up without waiting for the listing TTL.
+    (backup_path / "a.db").unlink()
+    mtime_ns = backup_path.stat().st_mtime_ns + 1_000_000
+    os.utime(backup_path, ns=(mtime_ns, mtime_ns))
+    assert _list_backups(backup_path) == ()
+
+
+def test_admin_queue(client: TestClient):
+    client.get("/admin/sync")
+    response = client.get("/admin/queue", params={"status": "preprocess_description"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert {item["status"] for item in data["items"]} == {"preprocess_description"}
+
+    response = client.get("/admin/queue", params={"status": "bogus"})
+    assert response.status_code == 400
+
+
+def test_admin_list_users_cursor(client: TestClient):
+    for i in range(3):
+        client.post("/auth/signup", json=UserCreate(email=f"cursor{i}@example.com", password="pass").model_dump())
+
+    response = client.get("/admin/users", params={"per_page": 2})
+    data = response.json()
+    assert [u["email"] for u in data["users"]] == ["cursor0@example.com", "cursor1@example.com"]
+    assert data["total"] == 3
+
+    response = client.get("/admin/users", params={"per_page": 2, "after_id": data["next_cursor"]})
+    data = response.json()
+    assert [u["email"] for u in data["users"]] == ["cursor2@example.com"]
+    assert data["next_cursor"] is None
+
+
+def test_admin_queue_refresh(client: TestClient):
+    client.get("/admin/sync")
+    response = client.post("/admin/queue/refresh", json={"status": "failed", "movie_ids": [550]})
+    assert response.status_code == 200
+    assert response.json()["detail"] == "Updated 1 queue entries to 'failed'"
+
+    # Emulate SQLite builds before 3.32, which cap a statement at 999 bound parameters.
+    raw_connection = test_engine.raw_connection()
+    try:
+        previous = raw_connection.driver_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        movie_ids = [550, 551, *range(1_000_000, 1_000_000 + IN_CLAUSE_CHUNK_SIZE)]
+        response = client.post("/admin/queue/refresh", json={"status": "failed", "movie_ids": movie_ids})
+        assert response.status_code == 200
+        assert response.json()["detail"] == "Updated 2 queue entries to 'failed'"
+    finally:
+        raw_connection.driver_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, previous)
+        raw_connection.close()
+
+    response = client.post("/admin/queue/refresh", json={"status": "bogus"})
+    assert response.status_code == 400
@@ -0,0 +1,28 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from backend.application.auth_service import decode_access_token, generate_access_token
+from backend.domain.errors import InvalidTokenError
+from backend.infrastructure.db.models import User
+
+SECRET = "test-secret-key-with-at-least-32-bytes"
+
+
+def test_cached_token_expiry_is_rechecked(monkeypatch):
+    token = generate_access_token({"sub": "test@example.com"}, SECRET, expires_delta=timedelta(seconds=30))
+    assert decode_access_token(token, SECRET)["sub"] == "test@example.com"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    with pytest.raises(InvalidTokenError):
+        decode_access_token(token, SECRET)
+
+
+def test_user_scope_set_follows_scopes():
+    user = User(email="scopes@example.com", hashed_password="none", scopes="movie:read")
+    assert user.scope_set == {"movie:read"}
+
+    user.scopes = "movie:read movie:write"
+    assert user.scope_set == {"movie:read", "movie:write"}
@@ -17,20 +17,14 @@ def test_fetch_movie_details(tmdb_client):
     assert movie.genres == "Drama, Crime, Action"
     assert movie.spoken_languages == "English, Urdu, Mandarin"
 
-    movies = tmdb_client.fetch_popular_ids()
-    assert isinstance(movies, set)
-    assert len(movies) > 0
-    assert all(isinstance(id, int) for id in movies)
-
-    movies = tmdb_client.fetch_now_playing_ids()
-    assert isinstance(movies, set)
-    assert len(movies) > 0
-    assert all(isinstance(id, int) for id in movies)
-
-    movies = tmdb_client.fetch_top_rated_ids()
-    assert isinstance(movies, set)
-    assert len(movies) > 0
-    assert all(isinstance(id, int) for id in movies)
+    assert tmdb_client.fetch_listing_genre_ids() == {550: [18, 53], 551: [99], 552: None}
 
     with pytest.raises(RequestException):
         tmdb_client.fetch_movie_details(99999999)
+
+
+def test_fetch_many_details(tmdb_client):
+    results = dict(tmdb_client.fetch_many_details([272, 99999999]))
+    assert results[272].title == "Batman Begins"
+    assert isinstance(results[99999999], RequestException)
+    assert list(tmdb_client.fetch_many_details([])) == []
@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+from requests import RequestException
+from sqlalchemy import select, update
+
+from backend.core.settings import get_settings
+from backend.infrastructure.db.models import Movie, MovieQueue, QueueStatus
+from backend.infrastructure.db.repositories.queue import QueueRepository
+from backend.infrastructure.external.tmdb_client import TMDBClient
+from backend.infrastructure.scheduler import jobs
+from tests.conftest import TestingSessionLocal, mock_requests_get
+
+FAILING_IDS = ("99999998", "99999999")
+
+
+def _mock_get(self, url, **kwargs):
+    if url.split("/")[-1] in FAILING_IDS:
+        raise RequestException("Movie not found")
+    return mock_requests_get(url, **kwargs)
+
+
+def test_process_queue_refresh_database(in_memory_test_db, monkeypatch):
+    monkeypatch.setattr("backend.infrastructure.external.tmdb_client.requests.Session.get", _mock_get)
+    monkeypatch.setattr(jobs, "REFRESH_CHUNK_SIZE", 3)
+    warning = Mock()
+    monkeypatch.setattr(jobs.logger, "warning", warning)
+
+    session = TestingSessionLocal()
+    session.add_all([Movie(tmdb_id=int(tmdb_id), title="Missing") for tmdb_id in FAILING_IDS])
+    session.commit()
+    QueueRepository(session).insert_missing()
+    session.execute(update(MovieQueue).values(status=QueueStatus.REFRESH_DATA))
+    session.commit()
+    session.close()
+
+    jobs.process_queue_refresh_database(TestingSessionLocal, TMDBClient(api_key="test_api_key"), get_settings())
+    warning.assert_called_with("Refreshed '4' movie(s): '2' failed, '2' with changes.")
+
+    session = TestingSessionLocal()
+    queues = {q.tmdb_id: q for q in session.execute(select(MovieQueue)).scalars()}
+    assert queues[550].status == QueueStatus.PREPROCESS_DESCRIPTION
+    assert session.execute(select(Movie.title).where(Movie.tmdb_id == 550)).scalar() == "Batman Begins"
+    for tmdb_id in FAILING_IDS:
+        queue = queues[int(tmdb_id)]
+        assert (queue.status, queue.retries, queue.message) == (QueueStatus.REFRESH_DATA, 1, "Movie not found")
+    session.close()
@@ -1,9 +1,13 @@
 
+from datetime import date
+
 import pytest
 from pydantic import ValidationError
 
+from backend.api.schemas.movie import MovieSchema
+from backend.infrastructure.db.models import Movie
 from backend.infrastructure.external.tmdb_client import TMDBMovieData
-from backend.domain.policies import is_acceptable_movie
+from backend.domain.policies import is_acceptable_movie, is_acceptable_prefilter
 
 
 def test_valid_movie_create(example_response):
@@ -312,3 +316,30 @@ def test_is_my_kind_of_movie_no_language_valid_genre(example_response):
     example_response.update(data)
     movie = TMDBMovieData(**example_response)
     assert is_acceptable_movie(movie.genres, movie.spoken_languages) is False
+
+
+def test_movie_schema_release_date_formats():
+    expected = date(2012, 4, 25)
+    assert MovieSchema(tmdb_id=1, title="x", release_date=20120425).release_date == expected
+    assert MovieSchema(tmdb_id=1, title="x", release_date="20120425").release_date == expected
+    with pytest.raises(ValidationError):
+        MovieSchema(tmdb_id=1, title="x", release_date=20121345)
+
+
+def test_is_acceptable_prefilter():
+    assert is_acceptable_prefilter([28, 12])
+    assert is_acceptable_prefilter([99, 18])
+    assert is_acceptable_prefilter(None)
+    assert not is_acceptable_prefilter([])
+    assert not is_acceptable_prefilter([99])
+    assert not is_acceptable_prefilter([10402])
+    assert not is_acceptable_prefilter([99, 10402, 18])
+
+
+def test_movie_description(example_response):
+    movie = Movie(**TMDBMovieData(**example_response).model_dump())
+    description = movie.get_description()
+    assert description.startswith("Overview: Driven by tragedy")
+    assert ". Tagline: Evil fears the knight. Keywords: martial arts" in description
+    assert description.endswith("Spoken Languages: English, Urdu, Mandarin")
+    assert Movie(tmdb_id=1, title="x", overview="Hi!", genres="Drama").get_description() == "Overview: Hi. Genres: Drama"
@@ -0,0 +1,45 @@
+from datetime import date
+from unittest.mock import Mock
+
+from backend.api.schemas.movie import MovieFilter
+from backend.application import movie_service
+from backend.application.movie_service import MovieQueryService
+from backend.domain.policies import DEFAULT_RUNTIME_MIN, DEFAULT_VOTE_AVERAGE_MIN, DEFAULT_VOTE_COUNT_MIN
+from backend.infrastructure.db.models import MovieRecommendation
+from backend.infrastructure.db.repositories.movie import MovieRepository
+from tests.conftest import TestingSessionLocal
+
+
+def _prefiltered_tmdb_ids(vector_store: Mock) -> list[int]:
+    where = vector_store.query.call_args.args[1]
+    return next(cond["tmdb_id"]["$in"] for cond in where["$and"] if "$in" in cond.get("tmdb_id", {}))
+
+
+def test_title_prefilter_applies_filters_before_cap(in_memory_test_db, monkeypatch):
+    # Cap the title prefilter to a single ID; "Fight Club" (550) outscores "Test Movie" (551).
+    monkeypatch.setattr(movie_service, "PREFILTER_ID_LIMIT_MIN", 1)
+    monkeypatch.setattr(movie_service, "PREFILTER_IDS_PER_RESULT", 1)
+    session = TestingSessionLocal()
+    vector_store = Mock()
+    vector_store.query.return_value = []
+    service = MovieQueryService(MovieRepository(session), vector_store)
+
+    service.search(MovieFilter(description="a movie", title="i", release_date_from=date(2020, 1, 1)))
+    assert _prefiltered_tmdb_ids(vector_store) == [551]
+
+    session.add(MovieRecommendation(user_id=1, tmdb_id=550))
+    session.commit()
+    service.search_excluding(MovieFilter(description="a movie", title="i"), user_id=1)
+    assert _prefiltered_tmdb_ids(vector_store) == [551]
+    session.close()
+
+
+def test_movie_filter_threshold_defaults():
+    defaults = (DEFAULT_RUNTIME_MIN, DEFAULT_VOTE_AVERAGE_MIN, DEFAULT_VOTE_COUNT_MIN)
+    unset = MovieFilter(title="i")
+    assert (unset.runtime_min, unset.vote_average_min, unset.vote_count_min) == defaults
+    nulls = MovieFilter(title="i", runtime_min=None, vote_average_min=None, vote_count_min=None)
+    assert (nulls.runtime_min, nulls.vote_average_min, nulls.vote_count_min) == defaults
+    # An explicit 0 is a real threshold now, not a falsy value swapped for the default.
+    zeros = MovieFilter(title="i", vote_average_min=0, vote_count_min=0)
+    assert (zeros.vote_average_min, zeros.vote_count_min) == (0, 0)
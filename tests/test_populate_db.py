@@ -0,0 +1,141 @@
+import gzip
+import io
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+from requests import RequestException
+from sqlalchemy import select
+
+from backend.core.settings import get_settings
+from backend.infrastructure.db.models import Movie, MovieQueue
+from backend.infrastructure.external.tmdb_client import TMDBClient
+from tests.conftest import MOVIE_RESPONSE, MockResponseObject, TestingSessionLocal
+
+# populate_db needs the "prod" dependency group.
+pytest.importorskip("pandas")
+pytest.importorskip("regex")
+
+from backend import populate_db  # noqa: E402
+from backend.populate_db import LATIN_CHARS, is_mostly_latin  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("Fight Club", True),
+        ("Léon: The Professional (1994)", True),
+        ("Amélie", True),
+        ("Łódź, Ærø & Straße", True),
+        ("千と千尋の神隠し", False),
+        ("Брат 2", False),
+        ("Crouching Tiger 卧虎藏龙", False),
+        ("", False),
+        ("   ", False),
+    ],
+)
+def test_is_mostly_latin(title, expected):
+    assert is_mostly_latin(title, threshold=0.9) is expected
+
+    # Same answer as counting regex matches per title, as before the translate table.
+    text = title.strip()
+    if text:
+        assert is_mostly_latin(title, threshold=0.9) is (len(LATIN_CHARS.findall(text)) / len(text) >= 0.9)
+
+
+def _export_line(tmdb_id: int, original_title: str) -> str:
+    return json.dumps({"adult": False, "id": tmdb_id, "original_title": original_title, "popularity": 1.0, "video": False})
+
+
+# 550 is already in the DB, 2001 is filtered out as non-Latin, 1002 is listed twice in different windows
+# and the detail request for 1004 fails.
+EXPORT_LINES = [
+    _export_line(1001, "First"),
+    _export_line(550, "Fight Club"),
+    _export_line(2001, "Брат"),
+    _export_line(1002, "Second"),
+    _export_line(1003, "Third"),
+    _export_line(1004, "Fourth"),
+    _export_line(1002, "Second"),
+    _export_line(1005, "Fifth"),
+]
+
+
+class _StreamedExport:
+    def __init__(self, lines: list[str]):
+        self.raw = io.BytesIO(gzip.compress("\n".join(lines).encode("utf-8")))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+def test_populate_db_pipeline(in_memory_test_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(populate_db.requests, "get", lambda url, **kwargs: _StreamedExport(EXPORT_LINES))
+    monkeypatch.setattr(populate_db, "EXPORT_READ_CHUNK_SIZE", 3)
+    monkeypatch.setattr(populate_db, "FETCH_WINDOW_SIZE", 2)
+    monkeypatch.setattr(get_settings().populate_db, "commit_interval", 2)
+    monkeypatch.setattr(populate_db, "get_populate_db_paths", lambda: {"state_file": tmp_path / "state.json"})
+    # The background processor has its own tests; keep it off the shared in-memory connection.
+    monkeypatch.setattr(populate_db, "process_queue_descriptions", Mock())
+    monkeypatch.setattr(populate_db, "process_queue_add_to_vector_store", Mock())
+
+    fetched_ids: list[int] = []
+
+    def mock_get(self, url, **kwargs):
+        tmdb_id = int(url.split("/")[-1])
+        fetched_ids.append(tmdb_id)
+        if tmdb_id == 1004:
+            raise RequestException("Movie not found")
+        return MockResponseObject({**MOVIE_RESPONSE, "id": tmdb_id})
+
+    monkeypatch.setattr("backend.infrastructure.external.tmdb_client.requests.Session.get", mock_get)
+
+    movies = populate_db.download_and_filter_export_file("https://example.com/export.json.gz")
+    assert movies["id"].tolist() == [1001, 550, 1002, 1003, 1004, 1002, 1005]
+
+    populate_db.process_movies(movies, TestingSessionLocal, TMDBClient(api_key="test_api_key"), Mock())
+
+    assert 550 not in fetched_ids and 2001 not in fetched_ids
+    session = TestingSessionLocal()
+    movie_ids = session.execute(select(Movie.tmdb_id)).scalars().all()
+    queue_ids = session.execute(select(MovieQueue.tmdb_id)).scalars().all()
+    session.close()
+    assert sorted(movie_ids) == [550, 551, 1001, 1002, 1003, 1005]
+    assert sorted(queue_ids) == [1001, 1002, 1003, 1005]
+    assert populate_db.load_state() == len(movies)
+
+
+def test_finish_processing_in_background(monkeypatch):
+    passes: list[int] = []
+    pass_done = threading.Event()
+
+    def process_descriptions(session_factory):
+        passes.append(1)
+        pass_done.set()
+
+    monkeypatch.setattr(populate_db, "process_queue_descriptions", process_descriptions)
+    monkeypatch.setattr(populate_db, "process_queue_add_to_vector_store", Mock())
+    stop_processing, work_available = threading.Event(), threading.Event()
+    worker = threading.Thread(
+        target=populate_db.finish_processing_in_background, args=(stop_processing, work_available, None, None),
+    )
+    worker.start()
+    assert pass_done.wait(timeout=5)
+
+    # A producer commit triggers the next pass right away instead of after the 60s safety timeout.
+    pass_done.clear()
+    work_available.set()
+    assert pass_done.wait(timeout=5)
+
+    stop_processing.set()
+    work_available.set()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert len(passes) == 2